@@ -19,6 +19,7 @@ from nanobot.agent.tools.registry import ToolRegistry
 from nanobot.agent.tools.filesystem import ReadFileTool, WriteFileTool, EditFileTool, ListDirTool
 from nanobot.agent.tools.shell import ExecTool
 from nanobot.agent.tools.web import WebSearchTool, WebFetchTool
+from nanobot.agent.tools import http_pool, searxng_http_client
 from nanobot.agent.tools.message import MessageTool
 from nanobot.agent.tools.spawn import SpawnTool
 from nanobot.agent.tools.cron import CronTool
@@ -373,6 +374,12 @@ class AgentLoop:
                 pass  # MCP SDK cancel scope cleanup is noisy but harmless
             self._mcp_stack = None
 
+    async def close(self) -> None:
+        """Close MCP connections and the pooled HTTP clients used by web tools."""
+        await self.close_mcp()
+        await searxng_http_client.aclose_shared_client()
+        await http_pool.aclose_shared_client()
+
     def stop(self) -> None:
         """Stop the agent loop."""
         self._running = False
@@ -0,0 +1,42 @@
+"""Shared pooled HTTP clients for tools that call out to web services."""
+
+import asyncio
+import weakref
+
+import httpx
+from loguru import logger
+
+# HTTP/2 lets concurrent requests to one host share a connection; it needs h2
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0)
+
+# An AsyncClient's connection pool is bound to the event loop it was first used
+# on, so there is one shared client per running loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def shared_client() -> httpx.AsyncClient:
+    """
+    Get the pooled HTTP client shared by tools on the running event loop.
+
+    Callers must not close it; use aclose_shared_client() at shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(limits=DEFAULT_LIMITS, http2=HTTP2_AVAILABLE)
+        _clients[loop] = client
+        logger.debug("Created shared HTTP client (http2={})", HTTP2_AVAILABLE)
+    return client
+
+
+async def aclose_shared_client() -> None:
+    """Close the shared client of the running event loop, if one was created."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
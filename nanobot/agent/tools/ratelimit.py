@@ -0,0 +1,144 @@
+"""Adaptive client-side rate limiting for search backends."""
+
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable
+
+import httpx
+from loguru import logger
+
+# Status codes that mean "slow down" rather than "this request is wrong"
+RETRYABLE_STATUS = frozenset({429, 503})
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limiter with reactive backoff for rate-limited HTTP APIs.
+
+    Concurrency grows additively on success and shrinks multiplicatively when
+    the server pushes back (429/503). Retry-After and X-RateLimit-* headers
+    pause every caller sharing the limiter, not just the one that was throttled.
+    Throttled requests are retried with exponential backoff and jitter.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        min_concurrency: int = 1,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+    ):
+        """
+        Args:
+            max_concurrency: Upper bound on in-flight requests.
+            min_concurrency: Lower bound the limit never shrinks below.
+            increase: Added to the limit after each successful response.
+            decrease: Factor the limit is multiplied by when throttled.
+            max_attempts: Total attempts per request, including the first.
+            base_delay: Initial backoff in seconds when no Retry-After is sent.
+            max_delay: Cap on any single backoff in seconds.
+        """
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.increase = increase
+        self.decrease = decrease
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self.limit = float(max_concurrency)
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        self._cond: asyncio.Condition | None = None
+
+    async def acquire(self) -> None:
+        """Wait for a free slot and for any server-requested pause to pass."""
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        delay = self._blocked_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def release(self) -> None:
+        """Free a slot taken by acquire()."""
+        assert self._cond is not None
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def observe(self, response: httpx.Response, attempt: int = 0) -> float | None:
+        """
+        Adapt to a response.
+
+        Returns:
+            Seconds to wait before retrying if the server throttled us, else None.
+        """
+        remaining = _first_number(response.headers.get("x-ratelimit-remaining"))
+        if remaining is not None and remaining <= 0:
+            reset = _first_number(response.headers.get("x-ratelimit-reset"))
+            if reset:
+                self._pause(min(reset, self.max_delay))
+
+        if response.status_code not in RETRYABLE_STATUS:
+            self.limit = min(float(self.max_concurrency), self.limit + self.increase)
+            return None
+
+        self.limit = max(float(self.min_concurrency), self.limit * self.decrease)
+        delay = _retry_after(response.headers.get("retry-after"))
+        if delay is None:
+            delay = self.base_delay * (2 ** attempt)
+        delay = min(delay, self.max_delay) + random.uniform(0, self.base_delay)
+        self._pause(delay)
+        return delay
+
+    async def request(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Send a request under the limiter, retrying while the server throttles."""
+        for attempt in range(self.max_attempts):
+            await self.acquire()
+            try:
+                response = await send()
+            finally:
+                await self.release()
+
+            delay = self.observe(response, attempt)
+            if delay is None or attempt == self.max_attempts - 1:
+                return response
+            logger.debug(
+                "Rate limited ({}), retrying in {:.1f}s (attempt {}/{}, limit={:.1f})",
+                response.status_code, delay, attempt + 1, self.max_attempts, self.limit,
+            )
+        return response
+
+    def _pause(self, seconds: float) -> None:
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+def _first_number(value: str | None) -> float | None:
+    """Parse the first value of a possibly comma-separated header (e.g. Brave's "0, 1999")."""
+    if not value:
+        return None
+    try:
+        return float(value.split(",", 1)[0].strip())
+    except ValueError:
+        return None
+
+
+def _retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    seconds = _first_number(value)
+    if seconds is not None:
+        return max(seconds, 0.0)
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
@@ -1,14 +1,436 @@
 """Research tool cloning Perplexica's iterative deep research mechanism."""
 
 import asyncio
-import json
+import functools
+import hashlib
+import heapq
+import io
+import itertools
+import re
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable, Iterator, NamedTuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
 from loguru import logger
 
 from nanobot.agent.tools.base import Tool
 from nanobot.agent.tools.web import WebSearchTool, WebFetchTool
+from nanobot.utils import jsonio
+from nanobot.utils.cache import TTLCache
+
+# Maximum research iterations per mode (cloning Perplexica's approach)
+_MODE_ITERATIONS = {"speed": 2, "balanced": 6, "quality": 25}
+
+# Early stopping rules per mode, called as rule(iteration, new_findings_count).
+# Clones Perplexica's early stopping logic:
+# - Speed mode: stop after first successful search
+# - Balanced: stop once an iteration past the third yields nothing new
+# - Quality: only stop if completely stuck
+_EARLY_STOP_RULES: dict[str, Callable[[int, int], bool]] = {
+    "speed": lambda i, n: i >= 1 and n > 0,
+    "balanced": lambda i, n: i >= 3 and n == 0,
+    "quality": lambda i, n: i >= 10 and n == 0,
+}
+
+# One numbered result as formatted by WebSearchTool (DuckDuckGo/Brave/Searxng),
+# captured with all of its fields in a single match:
+#   1. Title
+#      https://example.com/page
+#      Snippet text
+#      Engine: bing            (Searxng only)
+#      Published: 2024-01-01   (Searxng only)
+# Any further indented lines belong to the result and are skipped.
+_RESULT_RE = re.compile(
+    r"^[ \t]*\d+\.[ \t]*(?P<title>[^\n]*?)[ \t]*\n"
+    r"[ \t]+(?P<url>https?://\S+)[ \t]*$"
+    r"(?:\n[ \t]+(?!Engine:|Published:)(?P<snippet>\S[^\n]*?)[ \t]*$)?"
+    r"(?:\n[ \t]+Engine:[ \t]*(?P<engine>[^\n]*?)[ \t]*$)?"
+    r"(?:\n[ \t]+Published:[ \t]*(?P<published>[^\n]*?)[ \t]*$)?"
+    r"(?:\n[ \t]+\S[^\n]*)*",
+    re.MULTILINE,
+)
+
+# Query parameters that only track the click and never change the page (plus utm_*)
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid"})
+
+# Number of search workers per research call, bounding in-flight searches
+# to protect the search backend
+_MAX_CONCURRENT_SEARCHES = 16
+
+# Findings kept for the report; only the most relevant are retained while
+# collecting, the rest are counted
+_MAX_REPORTED_FINDINGS = 20
+
+# Iterations searched ahead of the one being consumed. Plans are deterministic,
+# so the next iteration's searches overlap the current one's; searches beyond
+# that window are only issued once early stopping has had its say
+_PREFETCH_ITERATIONS = 1
+
+# Search results longer than this (in characters) are parsed in a worker
+# thread so large responses don't stall the event loop
+_THREAD_PARSE_THRESHOLD = 4096
+
+# Reports whose findings hold more text than this (in characters) are built
+# in a worker thread; smaller ones are cheaper to build inline
+_THREAD_SYNTHESIS_THRESHOLD = 16384
+
+
+# Query templates for the first (overview) iteration in every mode
+_BROAD_TEMPLATES = ("{q}", "{q} overview")
+
+# Query templates for speed-mode iterations after the first
+_SPEED_TEMPLATES = ("{q} latest", "{q} examples")
+
+# Multi-angle query templates for balanced/quality iterations, as
+# (query template, Searxng engines, Searxng categories, Searxng time range)
+_ANGLE_TEMPLATES: tuple[tuple[str, tuple[str, ...], tuple[str, ...], str | None], ...] = (
+    # Features/capabilities - general search
+    ("{q} features", ("duckduckgo", "bing"), ("general",), None),
+    ("{q} how it works", ("duckduckgo",), ("general",), None),
+    # Comparisons - use multiple engines for diverse perspectives
+    ("{q} vs alternatives", ("duckduckgo", "brave", "bing"), ("general",), None),
+    ("{q} comparison", ("duckduckgo",), ("general",), None),
+    # Recent info - use news category with time filter
+    ("{q} latest news", ("bing", "brave"), ("news",), "week"),
+    ("{q} recent", ("duckduckgo",), ("news",), "month"),
+    # Reviews/opinions
+    ("{q} review", ("duckduckgo", "bing"), ("general",), None),
+    ("{q} analysis", ("brave",), ("general",), None),
+    # Use cases
+    ("{q} examples", ("duckduckgo",), ("general",), None),
+    ("{q} use cases", ("bing",), ("general",), None),
+    # Limitations/critiques
+    ("{q} problems", ("duckduckgo",), ("general",), None),
+    ("{q} limitations", ("brave",), ("general",), None),
+    # Technical/deep dive
+    ("{q} technical", ("duckduckgo",), ("general",), None),
+    ("{q} explained", ("wikipedia", "duckduckgo"), ("general",), None),
+)
+
+
+def _never_stop(iteration: int, new_findings: int) -> bool:
+    return False
+
+
+class _YieldTracker:
+    """
+    Tracks new sources per iteration to detect when a topic is saturated.
+
+    The EMA of new sources per iteration is the slope of the cumulative
+    unique-source curve; once it falls well below its peak and the last
+    iterations found nothing, further searches are unlikely to pay off.
+    """
+
+    __slots__ = ("ema", "peak", "zero_streak")
+
+    ALPHA = 0.3
+    MIN_ITERATIONS = 3
+    MIN_ZERO_STREAK = 2
+    PEAK_FRACTION = 0.15
+
+    def __init__(self) -> None:
+        self.ema: float | None = None
+        self.peak = 0.0
+        self.zero_streak = 0
+
+    def update(self, new_sources: int) -> None:
+        self.ema = new_sources if self.ema is None else (1 - self.ALPHA) * self.ema + self.ALPHA * new_sources
+        self.peak = max(self.peak, self.ema)
+        self.zero_streak = self.zero_streak + 1 if new_sources == 0 else 0
+
+    def saturated(self, iteration: int) -> bool:
+        return (
+            iteration >= self.MIN_ITERATIONS
+            and self.zero_streak >= self.MIN_ZERO_STREAK
+            and self.ema is not None
+            and self.ema < self.PEAK_FRACTION * self.peak
+        )
+
+
+# Words of a finding's title and snippet, for near-duplicate fingerprints
+_WORD_RE = re.compile(r"\w+")
+
+# SimHash bit counts are kept in fixed-width lanes; _BYTE_LANES[b] has a 1 in
+# the lane of every bit set in byte b
+_LANE_BITS = 32
+_BYTE_LANES = tuple(sum(1 << (bit * _LANE_BITS) for bit in range(8) if value >> bit & 1) for value in range(256))
+
+
+class _NearDuplicateIndex:
+    """
+    Detects findings whose title and snippet nearly match an earlier one.
+
+    Each text gets a 64-bit SimHash over word 3-grams; two texts are near
+    duplicates when their SimHashes differ in at most MAX_DISTANCE bits. The
+    hash is split into four 16-bit bands, so by pigeonhole any near duplicate
+    shares at least one band exactly; only fingerprints in a shared band
+    bucket are compared.
+    """
+
+    __slots__ = ("_buckets",)
+
+    MAX_DISTANCE = 3
+    MIN_WORDS = 6
+    BANDS = 4
+    BAND_BITS = 16
+
+    def __init__(self) -> None:
+        self._buckets: dict[tuple[int, int], list[int]] = {}
+
+    @staticmethod
+    def simhash(words: list[str]) -> int:
+        """64-bit SimHash of a word sequence, using its word 3-grams as features."""
+        # Per-bit set counts are summed in 32-bit lanes of one big int, a byte
+        # of each feature hash at a time, instead of looping over 64 bits
+        lanes = 0
+        for i in range(len(words) - 2):
+            # blake2b rather than hash(), which is salted per process
+            digest = hashlib.blake2b(" ".join(words[i:i + 3]).encode(), digest_size=8).digest()
+            for index, byte in enumerate(digest):
+                lanes += _BYTE_LANES[byte] << (index * 8 * _LANE_BITS)
+        features = len(words) - 2
+        lane_mask = (1 << _LANE_BITS) - 1
+        # A bit is set when more than half of the features have it set
+        return sum(1 << bit for bit in range(64) if (lanes >> (bit * _LANE_BITS) & lane_mask) * 2 > features)
+
+    def add(self, text: str) -> bool:
+        """Record text, returning False if it nearly duplicates recorded text."""
+        words = _WORD_RE.findall(text.lower())
+        # Too little text to fingerprint reliably; never treat it as a duplicate
+        if len(words) < self.MIN_WORDS:
+            return True
+
+        fingerprint = self.simhash(words)
+        mask = (1 << self.BAND_BITS) - 1
+        keys = [(band, fingerprint >> (band * self.BAND_BITS) & mask) for band in range(self.BANDS)]
+        for key in keys:
+            for other in self._buckets.get(key, ()):
+                if (fingerprint ^ other).bit_count() <= self.MAX_DISTANCE:
+                    return False
+        for key in keys:
+            self._buckets.setdefault(key, []).append(fingerprint)
+        return True
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Normalize a URL into a dedup key.
+
+    The scheme and fragment are dropped, the host is lowercased without a
+    leading "www.", an empty path becomes "/", and the query loses tracking
+    params and is sorted, so http/https, www and tracking variants of one
+    page share a key.
+    """
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    key = f"{host}{parts.path or '/'}"
+    if parts.query:
+        params = [
+            (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if not k.startswith("utm_") and k not in _TRACKING_PARAMS
+        ]
+        if params:
+            key = f"{key}?{urlencode(sorted(params))}"
+    return key
+
+
+# (epoch second, formatted timestamp) of the last report
+_timestamp_cache: tuple[int, str] = (0, "")
+
+
+def _now_str() -> str:
+    """Current local time as "%Y-%m-%d %H:%M:%S", formatted at most once per second."""
+    global _timestamp_cache
+    now = int(time.time())
+    if _timestamp_cache[0] != now:
+        _timestamp_cache = (now, datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S"))
+    return _timestamp_cache[1]
+
+
+class HistoryEntry(NamedTuple):
+    """One research iteration as recorded in the report's search history."""
+
+    iteration: int
+    new_sources: int
+    plan: str
+    queries: tuple[str, ...]
+
+
+@dataclass(slots=True)
+class Finding:
+    """A deduplicated search result collected during research."""
+
+    url: str = ""
+    title: str = ""
+    snippet: str = ""
+    engine: str = ""
+    published_date: str = ""
+
+    def to_dict(self) -> dict[str, str]:
+        """Serialize for the JSON report, omitting metadata the engine didn't provide."""
+        data = {"url": self.url, "title": self.title, "snippet": self.snippet}
+        if self.engine:
+            data["engine"] = self.engine
+        if self.published_date:
+            data["publishedDate"] = self.published_date
+        return data
+
+
+def _relevance(query_tokens: frozenset[str], finding: Finding) -> int:
+    """Score a finding by the query words in its title (counted double) and snippet."""
+    title_hits = len(query_tokens.intersection(_WORD_RE.findall(finding.title.lower())))
+    snippet_hits = len(query_tokens.intersection(_WORD_RE.findall(finding.snippet.lower())))
+    return 2 * title_hits + snippet_hits
+
+
+def _ranked(top_findings: list[tuple[int, int, Finding]]) -> list[Finding]:
+    """Findings from a top-findings heap, most relevant first, then by arrival."""
+    return [finding for _, _, finding in sorted(top_findings, key=lambda e: e[:2], reverse=True)]
+
+
+def _encode_finding(obj: Any) -> dict[str, str]:
+    """JSON encoder hook so report findings serialize without a dict copy up front."""
+    if isinstance(obj, Finding):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Appended to the report summary when research found no sources
+_NO_FINDINGS_HELP = (
+    "\n"
+    "No specific sources were found for this query. This could be due to:\n"
+    "- Search engine connectivity issues\n"
+    "- The query may be too specific or unclear\n"
+    "- Rate limiting on search engines\n"
+    "\n"
+    "**Suggestions:**\n"
+    "- Try rephrasing your query with different keywords\n"
+    "- Try using the 'speed' mode for quicker results\n"
+    "- Check if the search engines are accessible\n"
+)
+
+
+def _render_finding(index: int, finding: Finding) -> str:
+    """Render one finding as a Markdown block for the report summary."""
+    source = f"**Source:** {finding.url}\n" if finding.url else ""
+    excerpt = f"**Excerpt:** {finding.snippet}\n" if finding.snippet else ""
+    return f"### {index}. {finding.title or 'Untitled'}\n{source}{excerpt}\n"
+
+
+class Strategy(NamedTuple):
+    """
+    One planned search. Immutable and hashable, so cached plans can be shared.
+    """
+
+    query: str
+    engines: tuple[str, ...] | None = None  # Searxng engines (None: server default)
+    categories: tuple[str, ...] | None = None  # Searxng categories
+    time_range: str | None = None  # Searxng time filter
+    engine: str | None = None  # Search backend override (None: tool default)
+
+    def key(self) -> tuple:
+        """Identity of the search this strategy issues; engine/category order doesn't matter."""
+        return (
+            self.query,
+            tuple(sorted(self.engines or ())),
+            tuple(sorted(self.categories or ())),
+            self.time_range,
+            self.engine,
+        )
+
+
+# (canonical URL, finding) pairs parsed from one search response
+ParsedResults = list[tuple[str, Finding]]
+# What a search worker hands back for one strategy
+SearchOutcome = ParsedResults | Exception
+
+
+@functools.lru_cache(maxsize=1024)
+def _search_strategies(
+    base_query: str,
+    iteration: int,
+    mode: str,
+    use_searxng: bool,
+) -> tuple[Strategy, ...]:
+    """
+    Generate search strategies for the current iteration.
+
+    Each strategy includes:
+    - query: Search query string
+    - engine: Search engine to use (optional, defaults to tool default)
+    - engines: Engines for Searxng (optional)
+    - categories: Search categories for Searxng (optional)
+    - time_range: Time filter for Searxng (optional)
+
+    This implements Perplexica's query generation strategy with Searxng enhancements:
+    - Start broad, then narrow down
+    - Use different engines/categories for different query types
+    - Explore different angles of the topic
+
+    The result only depends on the arguments, so it is memoized; strategies
+    are immutable, so cached plans are safely shared between calls.
+    """
+    # Iteration 0: Broad overview queries in every mode
+    if iteration == 0:
+        return _gen_broad(base_query, iteration, mode, use_searxng)
+
+    # Iteration 1+: Specialized queries based on mode
+    generate = _STRATEGY_GENERATORS.get(mode, _gen_multi)
+    return generate(base_query, iteration, mode, use_searxng)
+
+
+def _gen_broad(base_query: str, iteration: int, mode: str, use_searxng: bool) -> tuple[Strategy, ...]:
+    """
+    Broad overview queries - let Searxng use all engines for diverse results.
+
+    Speed mode only issues the bare query; the overview variant mostly returns
+    the same pages and adds a round-trip to the critical path.
+    """
+    templates = _BROAD_TEMPLATES[:1] if mode == "speed" else _BROAD_TEMPLATES
+    # No engines/categories: let Searxng decide - use all available engines
+    return tuple(Strategy(template.format(q=base_query)) for template in templates)
+
+
+def _gen_speed(base_query: str, iteration: int, mode: str, use_searxng: bool) -> tuple[Strategy, ...]:
+    """Speed mode: targeted queries only."""
+    return tuple(Strategy(template.format(q=base_query)) for template in _SPEED_TEMPLATES)
+
+
+def _gen_multi(base_query: str, iteration: int, mode: str, use_searxng: bool) -> tuple[Strategy, ...]:
+    """
+    Balanced/Quality: Multi-angle exploration, one or two angles per iteration.
+
+    For quality mode, we go through all angles; balanced mode skips some to
+    stay within its iteration limit.
+    """
+    strategy_idx = (iteration - 1) % len(_ANGLE_TEMPLATES)
+    indices = [strategy_idx]
+
+    # For quality mode or early iterations, add a second strategy
+    if mode == "quality" or iteration < 3:
+        indices.append((strategy_idx + 1) % len(_ANGLE_TEMPLATES))
+
+    selected: list[Strategy] = []
+    for idx in indices:
+        template, engines, categories, time_range = _ANGLE_TEMPLATES[idx]
+        query = template.format(q=base_query)
+        # Engines, categories and time filters are Searxng-only
+        if use_searxng:
+            selected.append(Strategy(query, engines, categories, time_range))
+        else:
+            selected.append(Strategy(query))
+
+    return tuple(selected)
+
+
+# Strategy generator for iterations after the first, per mode (default: _gen_multi)
+_STRATEGY_GENERATORS: dict[str, Callable[[str, int, str, bool], tuple[Strategy, ...]]] = {
+    "speed": _gen_speed,
+}
 
 
 class ResearchTool(Tool):
@@ -58,28 +480,44 @@ class ResearchTool(Tool):
         "required": ["query"],
     }
 
-    def __init__(self, api_key: str | None = None, max_results: int = 5):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_results: int = 5,
+        structured: bool = True,
+        report_ttl: float = 3600.0,
+    ):
         """
         Initialize research tool.
 
         Args:
             api_key: Optional Brave Search API key
             max_results: Default max results per search
+            structured: Take search results as dicts (WebSearchTool.execute_structured)
+                        instead of formatting them to text and parsing it back
+            report_ttl: Seconds a finished report is reused for the same query,
+                        mode and search settings (0 disables report caching)
         """
         # Check if Searxng URL is configured
         import os
         searxng_url = os.getenv("SEARXNG_URL", "")
         self.searxng_available = bool(searxng_url)
 
-        # Use Searxng by default if URL is configured, otherwise fall back to ddg
+        # Use Searxng by default if URL is configured, otherwise fall back to ddg.
+        # Without a client of its own, searches go through the event loop's
+        # shared pooled clients, so connections stay warm across research calls
         default_engine = "searxng" if self.searxng_available else "ddg"
         self.web_search = WebSearchTool(
             api_key=api_key,
             max_results=max_results,
-            engine=default_engine
+            engine=default_engine,
         )
         self.web_fetch = WebFetchTool()
         self.max_results = max_results
+        self.structured = structured
+        # Findings and report inputs of finished runs, keyed by query and
+        # research settings; reports are re-rendered so timestamps stay current
+        self._report_cache = TTLCache(maxsize=64, ttl=report_ttl) if report_ttl > 0 else None
 
     async def execute(
         self, query: str, mode: str = "balanced", max_results: int | None = None, use_searxng: bool | None = None, **kwargs: Any
@@ -101,432 +539,366 @@ class ResearchTool(Tool):
         # Determine if we should use Searxng
         use_searxng_engine = use_searxng if use_searxng is not None else self.searxng_available
 
-        # Determine iterations based on mode (cloning Perplexica's approach)
-        mode_iterations = {"speed": 2, "balanced": 6, "quality": 25}
-        max_iterations = mode_iterations.get(mode, 6)
+        base_query = query.lower().strip()
 
-        logger.info(f"Starting deep research (mode={mode}, max_iterations={max_iterations}, use_searxng={use_searxng_engine}): {query}")
+        # A repeat of a recent run is answered from the report cache
+        report_key = (base_query, mode, use_searxng_engine, max_results, self.structured)
+        if self._report_cache is not None and (cached := self._report_cache.get(report_key)) is not None:
+            logger.info("Returning cached research report (mode={}): {}", mode, query)
+            # Re-rendered from the cached findings so the timestamp is current
+            return await self._render_report(*cached)
+
+        # Determine iterations based on mode
+        max_iterations = _MODE_ITERATIONS.get(mode, 6)
+
+        should_stop_early = _EARLY_STOP_RULES.get(mode, _never_stop)
+        yield_tracker = _YieldTracker()
+
+        logger.info(
+            "Starting deep research (mode={}, max_iterations={}, use_searxng={}): {}",
+            mode, max_iterations, use_searxng_engine, query,
+        )
 
         # Research state
-        search_history = []
-        all_findings = []
-        seen_urls = set()
+        search_history: list[HistoryEntry] = []
+        # Min-heap of (relevance, -arrival, finding) holding the current top
+        # findings; ties keep the earlier arrival
+        top_findings: list[tuple[int, int, Finding]] = []
+        total_sources = 0
+        seen_urls: set[str] = set()
+        near_duplicates = _NearDuplicateIndex()
         current_plan = "Starting research with broad queries to get an overview"
 
-        try:
-            # Iterative research loop
-            for iteration in range(max_iterations):
-                logger.debug(f"Research iteration {iteration + 1}/{max_iterations}")
-
-                # Generate search strategies with engine/category configuration
-                search_strategies = await self._generate_search_strategies(
-                    query=query,
-                    iteration=iteration,
-                    max_iterations=max_iterations,
-                    mode=mode,
-                    use_searxng=use_searxng_engine,
-                    previous_findings=all_findings,
-                )
+        query_tokens = frozenset(_WORD_RE.findall(base_query))
 
+        try:
+            # Plan every iteration up front: strategies only depend on the query,
+            # iteration and mode, so the whole run can be searched concurrently.
+            # Neighbouring angles overlap, so queries already planned are
+            # dropped, and a step left with nothing new rotates to the next
+            # angle; the step budget ends the plan once every angle is used
+            research_plan: list[tuple[Strategy, ...]] = []
+            issued_queries: set[str] = set()
+            max_steps = max_iterations + len(_ANGLE_TEMPLATES)
+            step = 0
+            while len(research_plan) < max_iterations and step < max_steps:
+                search_strategies = _search_strategies(base_query, step, mode, use_searxng_engine)
+                step += 1
                 if not search_strategies:
                     logger.debug("No more search strategies, ending research")
                     break
-
-                # Update plan for progress tracking
-                strategies_summary = ", ".join([s["query"] for s in search_strategies[:2]])
-                current_plan = f"Searching for: {strategies_summary}"
-                if len(search_strategies) > 2:
-                    current_plan += f" and {len(search_strategies) - 2} more queries"
-
-                # Execute searches with their specific engine/category configs
-                search_tasks = []
-                for strategy in search_strategies[:3]:
-                    task = self.web_search.execute(
-                        strategy["query"],
-                        count=max_results,
-                        engine=strategy.get("engine"),
-                        engines=strategy.get("engines"),
-                        categories=strategy.get("categories"),
-                        time_range=strategy.get("time_range"),
-                    )
-                    search_tasks.append(task)
-
-                search_results = await asyncio.gather(*search_tasks, return_exceptions=True)
-
-                # Process results
-                iteration_findings = []
-                for i, result in enumerate(search_results):
-                    if isinstance(result, Exception):
-                        logger.warning(f"Search {i+1} failed: {result}")
-                        continue
-
-                    # Extract and deduplicate findings
-                    findings = self._extract_findings(result, seen_urls)
-                    iteration_findings.extend(findings)
-                    all_findings.extend(findings)
-
-                search_history.append({
-                    "iteration": iteration + 1,
-                    "strategies": search_strategies[:3],
-                    "new_sources": len(iteration_findings),
-                    "plan": current_plan,
-                })
-
-                # Check if we should stop early
-                if self._should_stop_early(iteration, iteration_findings, mode):
-                    logger.debug(f"Stopping early at iteration {iteration + 1} (no new findings)")
-                    break
+                fresh = tuple(s for s in search_strategies[:3] if s.query not in issued_queries)
+                if not fresh:
+                    continue
+                issued_queries.update(s.query for s in fresh)
+                research_plan.append(fresh)
+
+            # Give every planned search a future for its result. Searches are
+            # queued a window of iterations ahead of the consumer below, and a
+            # bounded pool of workers drains the queue
+            loop = asyncio.get_running_loop()
+            pending: asyncio.Queue[tuple[Strategy, asyncio.Future[SearchOutcome]]] = asyncio.Queue()
+            iteration_results = [
+                [loop.create_future() for _ in search_strategies] for search_strategies in research_plan
+            ]
+            queued_iterations = 0
+
+            def queue_through(last_iteration: int) -> None:
+                nonlocal queued_iterations
+                while queued_iterations <= min(last_iteration, len(research_plan) - 1):
+                    for item in zip(research_plan[queued_iterations], iteration_results[queued_iterations]):
+                        pending.put_nowait(item)
+                    queued_iterations += 1
+
+            total_searches = sum(len(search_strategies) for search_strategies in research_plan)
+            async with asyncio.TaskGroup() as tg:
+                workers = [
+                    tg.create_task(self._search_worker(pending, max_results))
+                    for _ in range(min(_MAX_CONCURRENT_SEARCHES, total_searches))
+                ]
+
+                # Consume results iteration by iteration so dedup and early stopping
+                # behave exactly as in the sequential loop
+                for iteration, search_strategies in enumerate(research_plan):
+                    logger.debug("Research iteration {}/{}", iteration + 1, len(research_plan))
+                    queue_through(iteration + _PREFETCH_ITERATIONS)
+
+                    # Update plan for progress tracking
+                    strategies_summary = ", ".join([s.query for s in search_strategies[:2]])
+                    current_plan = f"Searching for: {strategies_summary}"
+                    if len(search_strategies) > 2:
+                        current_plan += f" and {len(search_strategies) - 2} more queries"
+
+                    # Process results; workers have already parsed them, so only
+                    # the order-dependent dedup happens here
+                    iteration_findings: list[Finding] = []
+                    for i, future in enumerate(iteration_results[iteration]):
+                        parsed = await future
+                        if isinstance(parsed, Exception):
+                            logger.warning("Search {} failed: {}", i + 1, parsed)
+                            continue
+
+                        for finding in self._dedupe_findings(parsed, seen_urls, near_duplicates):
+                            iteration_findings.append(finding)
+                            entry = (
+                                _relevance(query_tokens, finding),
+                                -(total_sources + len(iteration_findings)),
+                                finding,
+                            )
+                            if len(top_findings) < _MAX_REPORTED_FINDINGS:
+                                heapq.heappush(top_findings, entry)
+                            else:
+                                heapq.heappushpop(top_findings, entry)
+
+                    total_sources += len(iteration_findings)
+                    search_history.append(HistoryEntry(
+                        iteration=iteration + 1,
+                        new_sources=len(iteration_findings),
+                        plan=current_plan,
+                        queries=tuple(s.query for s in search_strategies),
+                    ))
+
+                    # Check if we should stop early: the mode's rule, or new-source
+                    # yield has collapsed relative to its peak
+                    yield_tracker.update(len(iteration_findings))
+                    if should_stop_early(iteration, len(iteration_findings)):
+                        logger.debug("Stopping early at iteration {} (no new findings)", iteration + 1)
+                        break
+                    if yield_tracker.saturated(iteration):
+                        logger.debug("Stopping early at iteration {} (source yield saturated)", iteration + 1)
+                        break
+
+                # Stop the workers, dropping prefetched searches we won't use
+                for worker in workers:
+                    worker.cancel()
 
             # Synthesize findings
-            logger.info(f"Research completed: {len(all_findings)} total findings across {len(search_history)} iterations")
-            if not all_findings:
-                logger.warning(f"Research produced no findings for query: {query}")
+            logger.info("Research completed: {} total findings across {} iterations", total_sources, len(search_history))
+            if not total_sources:
+                logger.warning("Research produced no findings for query: {}", query)
 
-            return self._synthesize_results(query, all_findings, search_history, mode)
+            args = (query, _ranked(top_findings), search_history, mode, total_sources)
+            # Empty runs are likely transient (connectivity, rate limits); don't replay them
+            if self._report_cache is not None and total_sources:
+                self._report_cache.set(report_key, args)
+            return await self._render_report(*args)
 
         except Exception as e:
-            logger.error(f"Research failed: {e}")
-            return json.dumps({
+            logger.error("Research failed: {}", e)
+            return jsonio.dumps({
                 "error": str(e),
                 "query": query,
-                "partial_findings": all_findings[:5],
-            })
+                "partial_findings": _ranked(top_findings)[:5],
+            }, default=_encode_finding)
 
-    async def _generate_search_strategies(
-        self,
-        query: str,
-        iteration: int,
-        max_iterations: int,
-        mode: str,
-        use_searxng: bool,
-        previous_findings: list[dict],
-    ) -> list[dict]:
-        """
-        Generate search strategies for the current iteration.
-
-        Each strategy includes:
-        - query: Search query string
-        - engine: Search engine to use (optional, defaults to tool default)
-        - engines: List of engines for Searxng (optional)
-        - categories: Search categories for Searxng (optional)
-        - time_range: Time filter for Searxng (optional)
-
-        This implements Perplexica's query generation strategy with Searxng enhancements:
-        - Start broad, then narrow down
-        - Use different engines/categories for different query types
-        - Explore different angles of the topic
+    async def _search_worker(
+        self, pending: asyncio.Queue[tuple[Strategy, asyncio.Future[SearchOutcome]]], max_results: int
+    ) -> None:
         """
-        base_query = query.lower().strip()
-
-        # Iteration 0: Broad overview queries - let Searxng use all engines for diverse results
-        if iteration == 0:
-            strategies = [
-                {
-                    "query": base_query,
-                    "engines": None,  # Let Searxng decide - use all available engines
-                    "categories": None,
-                },
-                {
-                    "query": f"{base_query} overview",
-                    "engines": None,  # Let Searxng decide - use all available engines
-                    "categories": None,
-                },
-            ]
-            return strategies[:2] if mode == "speed" else strategies
-
-        # Iteration 1+: Specialized queries based on mode
-        if mode == "speed":
-            # Speed mode: targeted queries only
-            return [
-                {"query": f"{base_query} latest"},
-                {"query": f"{base_query} examples"},
-            ]
+        Run queued search strategies until cancelled.
 
-        # Balanced/Quality: Multi-angle exploration with Searxng
-        search_strategies = [
-            # Features/capabilities - general search
-            {
-                "query": f"{base_query} features",
-                "engines": ["duckduckgo", "bing"],
-                "categories": ["general"],
-            },
-            {
-                "query": f"{base_query} how it works",
-                "engines": ["duckduckgo"],
-                "categories": ["general"],
-            },
-            # Comparisons - use multiple engines for diverse perspectives
-            {
-                "query": f"{base_query} vs alternatives",
-                "engines": ["duckduckgo", "brave", "bing"],
-                "categories": ["general"],
-            },
-            {
-                "query": f"{base_query} comparison",
-                "engines": ["duckduckgo"],
-                "categories": ["general"],
-            },
-            # Recent info - use news category with time filter
-            {
-                "query": f"{base_query} latest news",
-                "engines": ["bing", "brave"],
-                "categories": ["news"],
-                "time_range": "week" if use_searxng else None,
-            },
-            {
-                "query": f"{base_query} recent",
-                "engines": ["duckduckgo"],
-                "categories": ["news"],
-                "time_range": "month" if use_searxng else None,
-            },
-            # Reviews/opinions
-            {
-                "query": f"{base_query} review",
-                "engines": ["duckduckgo", "bing"],
-                "categories": ["general"],
-            },
-            {
-                "query": f"{base_query} analysis",
-                "engines": ["brave"],
-                "categories": ["general"],
-            },
-            # Use cases
-            {
-                "query": f"{base_query} examples",
-                "engines": ["duckduckgo"],
-                "categories": ["general"],
-            },
-            {
-                "query": f"{base_query} use cases",
-                "engines": ["bing"],
-                "categories": ["general"],
-            },
-            # Limitations/critiques
-            {
-                "query": f"{base_query} problems",
-                "engines": ["duckduckgo"],
-                "categories": ["general"],
-            },
-            {
-                "query": f"{base_query} limitations",
-                "engines": ["brave"],
-                "categories": ["general"],
-            },
-            # Technical/deep dive
-            {
-                "query": f"{base_query} technical",
-                "engines": ["duckduckgo"],
-                "categories": ["general"],
-            },
-            {
-                "query": f"{base_query} explained",
-                "engines": ["wikipedia", "duckduckgo"],
-                "categories": ["general"],
-            },
-        ]
-
-        # Select strategies based on iteration
-        # For quality mode, we go through all strategies
-        # For balanced mode, we skip some to stay within iteration limit
-        strategy_idx = (iteration - 1) % len(search_strategies)
-
-        # Return 1-2 strategies per iteration
-        selected = [search_strategies[strategy_idx]]
-
-        # For quality mode or early iterations, add a second strategy
-        if mode == "quality" or iteration < 3:
-            next_idx = (strategy_idx + 1) % len(search_strategies)
-            selected.append(search_strategies[next_idx])
+        Each result is parsed as soon as it arrives, so parsing one response
+        overlaps the network wait of the others.
+        """
+        while True:
+            strategy, future = await pending.get()
+            result = await self._run_search(strategy, max_results)
+            outcome: SearchOutcome
+            if isinstance(result, Exception):
+                outcome = result
+            elif isinstance(result, list):
+                outcome = self._findings_from_results(result, max_results)
+            elif len(result) > _THREAD_PARSE_THRESHOLD:
+                outcome = await asyncio.to_thread(self._parse_findings, result, max_results)
+            else:
+                outcome = self._parse_findings(result, max_results)
+            if not future.done():
+                future.set_result(outcome)
+
+    async def _run_search(self, strategy: Strategy, max_results: int) -> str | list[dict[str, str]] | Exception:
+        """
+        Run one search strategy with its engine/category config.
 
-        # If not using Searxng, strip out Searxng-specific fields
-        if not use_searxng:
-            for strategy in selected:
-                strategy.pop("engines", None)
-                strategy.pop("categories", None)
-                strategy.pop("time_range", None)
+        Repeated searches are answered by WebSearchTool's result cache.
 
-        return selected
+        Returns result dicts in structured mode, formatted text otherwise.
+        """
+        search = self.web_search.execute_structured if self.structured else self.web_search.execute
+        # Sorted engines/categories, so reordered strategies share a cache entry
+        query, engines, categories, time_range, engine = strategy.key()
+        try:
+            result = await search(
+                query,
+                count=max_results,
+                engine=engine,
+                engines=list(engines) or None,
+                categories=list(categories) or None,
+                time_range=time_range,
+            )
+        except Exception as e:
+            # Returned rather than raised so one failed search can't abort the TaskGroup
+            return e
+        return result
 
-    def _extract_findings(self, search_result: str, seen_urls: set) -> list[dict]:
+    def _parse_findings(self, search_result: str, limit: int | None = None) -> ParsedResults:
         """
-        Extract structured findings from search results.
+        Parse search results into (canonical URL, finding) pairs, without dedup.
 
         Handles multiple formats:
         - DuckDuckGo format
         - Brave format
         - Searxng format (includes "Engine:" field)
 
-        Returns list of finding dicts with URL deduplication.
+        Independent of other results, so it runs in the search workers.
+        Matching is lazy, so with a limit the rest of the text is never scanned.
         """
-        findings = []
-
         if not search_result or search_result.startswith("Error:"):
-            logger.warning(f"Search returned no results or error: {search_result[:100]}")
-            return findings
-
-        # Parse DuckDuckGo/Brave/Searxng format
-        lines = search_result.split("\n")
-        current_finding = {}
+            logger.warning("Search returned no results or error: {}", search_result[:100])
+            return []
+
+        parsed: ParsedResults = []
+
+        # Each result is a numbered title line, an indented URL line and optional
+        # indented snippet/metadata lines; engine header lines never match
+        for match in itertools.islice(_RESULT_RE.finditer(search_result), limit):
+            url, title, snippet, engine, published = match.group("url", "title", "snippet", "engine", "published")
+            finding = Finding(
+                url=url,
+                title=title,
+                snippet=snippet or "",
+                engine=engine or "",
+                published_date=published or "",
+            )
 
-        for raw_line in lines:
-            # Skip empty lines
-            stripped = raw_line.strip()
-            if not stripped:
-                continue
+            # Dedup keys on the canonical form so tracking-param variants of
+            # one page collapse
+            parsed.append((_canonical_url(url), finding))
+
+        logger.debug("Parsed {} findings from search result", len(parsed))
+        return parsed
+
+    @staticmethod
+    def _findings_from_results(results: list[dict[str, str]], limit: int | None = None) -> ParsedResults:
+        """Build (canonical URL, finding) pairs from structured search results, without dedup."""
+        return [
+            (_canonical_url(item["url"]), Finding(
+                url=item["url"],
+                title=item.get("title", "").strip(),
+                snippet=item.get("snippet", "").strip(),
+                engine=item.get("engine", ""),
+                published_date=item.get("publishedDate", ""),
+            ))
+            for item in itertools.islice(results, limit)
+            if item.get("url")
+        ]
 
-            # Detect URL lines (indented with spaces) - check original line
-            if raw_line.startswith("   ") or raw_line.startswith("\t"):
-                # This is an indented line (URL, snippet, or metadata)
-                if stripped.startswith("http"):
-                    # This is a URL - add to current finding or check for duplicate
-                    if stripped not in seen_urls:
-                        seen_urls.add(stripped)
-                        # If we already have a finding with title, add URL to it
-                        if current_finding and current_finding.get("title") and not current_finding.get("url"):
-                            current_finding["url"] = stripped
-                        else:
-                            # This is a new finding (URL-first format)
-                            if current_finding and current_finding.get("url"):
-                                findings.append(current_finding)
-                            current_finding = {"url": stripped, "title": "", "snippet": ""}
-                    # Duplicate URL - skip this result
-                elif current_finding:
-                    # This is a snippet/description or metadata
-                    if stripped.startswith("Engine:"):
-                        current_finding["engine"] = stripped.replace("Engine:", "").strip()
-                    elif stripped.startswith("Published:"):
-                        current_finding["publishedDate"] = stripped.replace("Published:", "").strip()
-                    else:
-                        current_finding["snippet"] = stripped
-            # Detect result number (e.g., "1. Title")
-            elif stripped[0].isdigit() and "." in stripped[:3]:
-                # Save previous finding if it has a URL
-                if current_finding and current_finding.get("url"):
-                    findings.append(current_finding)
-                title_part = stripped.split(".", 1)[1].strip() if "." in stripped else stripped
-                current_finding = {"title": title_part, "url": "", "snippet": ""}
-            # Detect title (skip engine headers)
-            elif not stripped.startswith("DuckDuckGo") and not stripped.startswith("Brave") and not stripped.startswith("Searxng"):
-                if current_finding and not current_finding.get("title"):
-                    current_finding["title"] = stripped
-
-        # Add last finding if it has a URL
-        if current_finding and current_finding.get("url"):
-            findings.append(current_finding)
-
-        logger.debug(f"Extracted {len(findings)} findings from search result")
-        return findings
-
-    def _should_stop_early(
-        self, iteration: int, iteration_findings: list[dict], mode: str
-    ) -> bool:
+    @staticmethod
+    def _dedupe_findings(
+        parsed: ParsedResults,
+        seen_urls: set[str],
+        near_duplicates: _NearDuplicateIndex | None = None,
+    ) -> Iterator[Finding]:
         """
-        Determine if research should stop early.
+        Yield findings whose canonical URL is not in seen_urls yet, recording them.
 
-        Clones Perplexica's early stopping logic:
-        - Speed mode: stop after first successful search
-        - Balanced: stop if no new findings for 2 iterations
-        - Quality: rarely stop early
+        With a near-duplicate index, findings at a new URL whose title and
+        snippet nearly match an earlier finding (mirrors, reposts) are skipped too.
         """
-        if mode == "speed" and iteration >= 1:
-            return len(iteration_findings) > 0
-
-        if mode == "balanced" and iteration >= 3:
-            return len(iteration_findings) == 0
-
-        # Quality mode: only stop if completely stuck
-        if mode == "quality" and iteration >= 10:
-            return len(iteration_findings) == 0
+        for key, finding in parsed:
+            if key in seen_urls:
+                continue
+            seen_urls.add(key)
+            if near_duplicates is not None and not near_duplicates.add(f"{finding.title} {finding.snippet}"):
+                continue
+            yield finding
 
-        return False
+    async def _render_report(
+        self,
+        query: str,
+        findings: list[Finding],
+        search_history: list[HistoryEntry],
+        mode: str,
+        total_sources: int,
+    ) -> str:
+        """Synthesize a report, off the event loop when the findings are large."""
+        args = (query, findings, search_history, mode, total_sources)
+        # Report building and JSON encoding are pure CPU; only big reports are
+        # worth the thread hop to keep them off the loop
+        if sum(len(f.title) + len(f.snippet) for f in findings) > _THREAD_SYNTHESIS_THRESHOLD:
+            return await asyncio.to_thread(self._synthesize_results, *args)
+        return self._synthesize_results(*args)
 
     def _synthesize_results(
         self,
         query: str,
-        findings: list[dict],
-        search_history: list[dict],
+        findings: list[Finding],
+        search_history: list[HistoryEntry],
         mode: str,
+        total_sources: int | None = None,
     ) -> str:
         """
         Synthesize research findings into a comprehensive report.
 
-        Clones Perplexica's writer phase approach.
+        Clones Perplexica's writer phase approach. findings may be the ranked
+        top of everything found; total_sources is the full count
+        (defaults to len(findings)).
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if total_sources is None:
+            total_sources = len(findings)
+        timestamp = _now_str()
 
         result = {
             "query": query,
             "mode": mode,
             "timestamp": timestamp,
             "iterations_completed": len(search_history),
-            "total_sources": len(findings),
-            "search_history": search_history,
-            "findings": findings[:20],  # Limit to top 20 findings
+            "total_sources": total_sources,
+            "search_history": [entry._asdict() for entry in search_history],
+            # Limit to top 20 findings; serialized by _encode_finding
+            "findings": list(itertools.islice(findings, 20)),
         }
 
-        # Create a formatted summary
-        summary_lines = [
-            f"# Research Results: {query}",
-            f"",
-            f"**Mode:** {mode}",
-            f"**Date:** {timestamp}",
-            f"**Iterations:** {len(search_history)}",
-            f"**Sources Found:** {len(findings)}",
-            f"",
-            f"## Research Process",
-        ]
+        # Create a formatted summary, written straight into one buffer
+        buf = io.StringIO()
+        write = buf.write
+        write(
+            f"# Research Results: {query}\n\n"
+            f"**Mode:** {mode}\n"
+            f"**Date:** {timestamp}\n"
+            f"**Iterations:** {len(search_history)}\n"
+            f"**Sources Found:** {total_sources}\n\n"
+            f"## Research Process\n"
+        )
 
-        for entry in search_history:
-            summary_lines.append(
-                f"- Iteration {entry['iteration']}: {entry['plan']} "
-                f"({entry['new_sources']} new sources)"
-            )
+        write("".join(
+            f"- Iteration {iteration}: {plan} ({new_sources} new sources)\n"
+            for iteration, new_sources, plan, _ in search_history
+        ))
 
-        summary_lines.extend([
-            f"",
-            f"## Key Findings",
-            f"",
-        ])
+        write("\n## Key Findings\n\n")
 
         # Add top findings
-        for i, finding in enumerate(findings[:10], 1):
-            summary_lines.append(f"### {i}. {finding.get('title', 'Untitled')}")
-            if finding.get('url'):
-                summary_lines.append(f"**Source:** {finding['url']}")
-            if finding.get('snippet'):
-                summary_lines.append(f"**Excerpt:** {finding['snippet']}")
-            summary_lines.append("")
+        write("".join(_render_finding(i, f) for i, f in enumerate(itertools.islice(findings, 10), 1)))
 
-        if len(findings) > 10:
-            summary_lines.append(f"*... and {len(findings) - 10} more sources*")
+        if total_sources > 10:
+            write(f"*... and {total_sources - 10} more sources*\n")
 
         # Add a message if no findings were found
         if not findings:
-            summary_lines.extend([
-                f"",
-                f"No specific sources were found for this query. This could be due to:",
-                f"- Search engine connectivity issues",
-                f"- The query may be too specific or unclear",
-                f"- Rate limiting on search engines",
-                f"",
-                f"**Suggestions:**",
-                f"- Try rephrasing your query with different keywords",
-                f"- Try using the 'speed' mode for quicker results",
-                f"- Check if the search engines are accessible",
-            ])
-
-        result["summary"] = "\n".join(summary_lines)
+            write(_NO_FINDINGS_HELP)
+
+        result["summary"] = buf.getvalue()
 
         # Ensure we never return empty content
-        json_output = json.dumps(result, indent=2, ensure_ascii=False)
+        json_output = jsonio.dumps(result, indent=True, default=_encode_finding)
         if not json_output or json_output == "{}":
             logger.error("Research synthesis produced empty output, returning fallback")
-            return json.dumps({
+            return jsonio.dumps({
                 "query": query,
                 "mode": mode,
                 "timestamp": timestamp,
                 "error": "Research synthesis failed - no output generated",
                 "summary": f"# Research Results: {query}\n\nUnable to generate research report. Please try again.",
-            }, ensure_ascii=False)
+            })
 
         return json_output
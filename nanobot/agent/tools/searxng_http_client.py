@@ -4,12 +4,33 @@ This module provides a client that makes HTTP requests to a running Searxng serv
 instead of importing Searxng as a Python library.
 """
 
+import asyncio
+import functools
 import os
+import time
+import weakref
 from typing import Any
 
 import httpx
 from loguru import logger
 
+from nanobot.agent.tools.http_pool import HTTP2_AVAILABLE
+from nanobot.agent.tools.ratelimit import AdaptiveLimiter
+from nanobot.utils import jsonio
+from nanobot.utils.cache import TTLCache
+
+# Result fields passed through only when the engine filled them in
+_OPTIONAL_FIELDS = ("publishedDate", "img_src", "thumbnail")
+
+# httpx already negotiates gzip/deflate (and br/zstd when their decoders are installed)
+_JSON_HEADERS = {"Accept": "application/json"}
+
+
+@functools.lru_cache(maxsize=64)
+def _join(names: tuple[str, ...]) -> str:
+    """Comma-join engine/category names; the same few combinations recur."""
+    return ",".join(names)
+
 
 class SearxngHttpClient:
     """
@@ -18,10 +39,20 @@ class SearxngHttpClient:
     Makes requests to a running Searxng server instead of importing it as a library.
     """
 
+    # Common Searxng engines
+    _ENGINES = ("duckduckgo", "brave", "bing", "google", "wikipedia", "startpage")
+    _CATEGORIES = (
+        "general", "images", "videos", "news", "map", "music", "it", "science", "files", "social media",
+    )
+
     def __init__(
         self,
         base_url: str | None = None,
         timeout: float = 30.0,
+        client: httpx.AsyncClient | None = None,
+        keepalive_expiry: float = 30.0,
+        max_parallel: int = 8,
+        cache_ttl: float = 0.0,
     ):
         """
         Initialize Searxng HTTP client.
@@ -30,26 +61,72 @@ class SearxngHttpClient:
             base_url: URL of the Searxng server (e.g., "http://localhost:8888").
                      Defaults to SEARXNG_URL env var or "http://localhost:8888".
             timeout: Request timeout in seconds.
+            client: Shared HTTP client to reuse pooled connections from. It is
+                    owned by the caller and not closed by close().
+            keepalive_expiry: Seconds an idle pooled connection is kept open.
+                              Keep it below the server's keepalive timeout
+                              (e.g. nginx's keepalive_timeout) so requests are
+                              not sent on connections the server already closed.
+            max_parallel: Maximum searches in flight at once, so bursts of
+                          concurrent searches don't flood the server. This is
+                          the ceiling of the adaptive limiter, which shrinks
+                          it while the server throttles; it is the only
+                          concurrency cap on Searxng requests.
+            cache_ttl: Seconds identical searches are answered from memory
+                       (Searxng itself does not cache). Off by default:
+                       WebSearchTool already caches results, and a second
+                       cache here would outlive its TTL and ignore its
+                       no_cache flag. Repeated searches are revalidated with
+                       ETags either way.
         """
         self.base_url = (base_url or os.getenv(
             "SEARXNG_URL", "http://localhost:8888"
         )).rstrip("/")
 
         self.timeout = timeout
-        self._client = None
+        self._client = client
+        self._owns_client = client is None
+        self.keepalive_expiry = keepalive_expiry
+        self._cache = TTLCache(maxsize=512, ttl=cache_ttl) if cache_ttl > 0 else None
+        # (ETag, results) per search, so a repeated search the server answers
+        # with 304 skips downloading and decoding the JSON again. Always on:
+        # every request still reaches the server, so nothing is served stale
+        self._validators = TTLCache(maxsize=512, ttl=24 * 3600.0)
+        # (checked_at, healthy) of the last health check
+        self._last_health: tuple[float, bool] | None = None
+        self._health_ttl = 10.0
+        # Backs off and shrinks concurrency when the server (or its upstream) throttles
+        self._limiter = AdaptiveLimiter(max_concurrency=max_parallel)
 
     def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            # Every request goes to the same host, so keep connections warm and
+            # multiplex concurrent searches over HTTP/2 when h2 is installed
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                http2=HTTP2_AVAILABLE,
+            )
         return self._client
 
     async def close(self):
-        """Close the HTTP client."""
-        if self._client:
+        """Close the HTTP client, unless it was supplied by the caller."""
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
 
+    async def __aenter__(self) -> "SearxngHttpClient":
+        self._get_client()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
     async def search(
         self,
         query: str,
@@ -59,6 +136,7 @@ class SearxngHttpClient:
         time_range: str | None = None,
         safesearch: int = 0,
         count: int = 10,
+        bypass_cache: bool = False,
     ) -> list[dict[str, Any]]:
         """
         Perform search using Searxng HTTP API.
@@ -73,6 +151,8 @@ class SearxngHttpClient:
             time_range: Time range filter ('day', 'week', 'month', 'year').
             safesearch: Safe search level (0=none, 1=moderate, 2=strict).
             count: Maximum number of results to return.
+            bypass_cache: Always query the server, e.g. for fresh news. The
+                          response still refreshes the cache.
 
         Returns:
             List of search result dictionaries with keys:
@@ -84,7 +164,33 @@ class SearxngHttpClient:
             - score: Result relevance score.
             - publishedDate: Publication date (if available).
         """
+        key = (query, tuple(engines or ()), tuple(categories or ()), language, time_range, safesearch, count)
+        if self._cache is not None and not bypass_cache:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return list(cached)
+
+        results = await self._search(query, engines, categories, language, time_range, safesearch, count, key)
+        # Failures come back as [], so only real answers are cached
+        if self._cache is not None and results:
+            self._cache.set(key, results)
+            return list(results)
+        return results
+
+    async def _search(
+        self,
+        query: str,
+        engines: list[str] | None,
+        categories: list[str] | None,
+        language: str,
+        time_range: str | None,
+        safesearch: int,
+        count: int,
+        key: tuple,
+    ) -> list[dict[str, Any]]:
         client = self._get_client()
+        validator = self._validators.get(key)
+        headers = _JSON_HEADERS if validator is None else {**_JSON_HEADERS, "If-None-Match": validator[0]}
 
         try:
             # Build query parameters for Searxng API
@@ -96,81 +202,94 @@ class SearxngHttpClient:
             }
 
             # Add optional parameters
-            if engines:
-                params["engines"] = ",".join(engines)
-            if categories:
-                params["categories"] = ",".join(categories)
+            # The cache key already holds engines/categories as tuples
+            _, engine_names, category_names, *_ = key
+            if engine_names:
+                params["engines"] = _join(engine_names)
+            if category_names:
+                params["categories"] = _join(category_names)
             if time_range:
                 params["time_range"] = time_range
             if count:
                 params["pageno"] = 1  # Always use first page
 
             # Make request to Searxng search API
-            response = await client.get(
+            response = await self._limiter.request(lambda: client.get(
                 f"{self.base_url}/search",
                 params=params,
-            )
+                headers=headers,
+                timeout=self.timeout,
+            ))
+            if response.status_code == 304 and validator is not None:
+                logger.debug("Searxng results unchanged (304): query='{}'", query)
+                return list(validator[1])
             response.raise_for_status()
 
-            data = response.json()
+            # Searxng has no result-count parameter, so the whole first page
+            # comes back; decode it from raw bytes with orjson when available
+            data = jsonio.loads(response.content)
 
             # Extract and format results
-            results = []
-            for result in data.get("results", [])[:count]:
-                formatted_result = {
+            results = [
+                {
                     "title": result.get("title", ""),
                     "url": result.get("url", ""),
                     "content": result.get("content", ""),
                     "engine": result.get("engine", ""),
                     "category": result.get("category", ""),
                     "score": result.get("score", 0.0),
+                    **{field: result[field] for field in _OPTIONAL_FIELDS if result.get(field)},
                 }
-
-                # Add optional fields
-                if result.get("publishedDate"):
-                    formatted_result["publishedDate"] = result["publishedDate"]
-                if result.get("img_src"):
-                    formatted_result["img_src"] = result["img_src"]
-                if result.get("thumbnail"):
-                    formatted_result["thumbnail"] = result["thumbnail"]
-
-                results.append(formatted_result)
+                for result in data.get("results", ())[:count]
+            ]
+            if results and (etag := response.headers.get("etag")):
+                self._validators.set(key, (etag, results))
 
             logger.debug(
-                f"Searxng HTTP search completed: query='{query}', engines={engines}, results={len(results)}"
+                "Searxng HTTP search completed: query='{}', engines={}, results={}", query, engines, len(results),
             )
             return results
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"Searxng HTTP error: {e.response.status_code} - {e.response.text}")
+            logger.error("Searxng HTTP error: {} - {}", e.response.status_code, e.response.text)
             return []
         except httpx.ConnectError:
-            logger.error(f"Failed to connect to Searxng server at {self.base_url}")
+            logger.error("Failed to connect to Searxng server at {}", self.base_url)
             return []
         except httpx.TimeoutException:
-            logger.error(f"Searxng request timed out")
+            logger.error("Searxng request timed out")
             return []
         except Exception as e:
-            logger.error(f"Searxng HTTP search failed: {e}")
+            logger.error("Searxng HTTP search failed: {}", e)
             return []
 
     async def health_check(self) -> bool:
         """
         Check if Searxng server is reachable.
 
+        The answer is reused for a few seconds, so callers can check before
+        every search without a request each time.
+
         Returns:
             True if server is reachable, False otherwise.
         """
+        now = time.monotonic()
+        if self._last_health is not None and now - self._last_health[0] < self._health_ttl:
+            return self._last_health[1]
+
         try:
             client = self._get_client()
-            response = await client.get(
+            # HEAD skips downloading the landing page HTML
+            response = await client.head(
                 f"{self.base_url}/",
                 timeout=5.0,
             )
-            return response.status_code == 200
+            healthy = response.status_code == 200
         except Exception as e:
-            logger.debug(f"Searxng health check failed: {e}")
-            return False
+            logger.debug("Searxng health check failed: {}", e)
+            healthy = False
+        self._last_health = (time.monotonic(), healthy)
+        return healthy
 
     def get_available_engines(self) -> list[str]:
         """
@@ -182,15 +301,7 @@ class SearxngHttpClient:
         Returns:
             List of engine names.
         """
-        # Common Searxng engines
-        return [
-            "duckduckgo",
-            "brave",
-            "bing",
-            "google",
-            "wikipedia",
-            "startpage",
-        ]
+        return list(self._ENGINES)
 
     def get_available_categories(self) -> list[str]:
         """
@@ -199,15 +310,32 @@ class SearxngHttpClient:
         Returns:
             List of category names.
         """
-        return [
-            "general",
-            "images",
-            "videos",
-            "news",
-            "map",
-            "music",
-            "it",
-            "science",
-            "files",
-            "social media",
-        ]
+        return list(self._CATEGORIES)
+
+
+# Like httpx clients, a SearxngHttpClient's pool belongs to the event loop it was
+# first used on, so there is one shared instance per running loop
+_shared: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SearxngHttpClient]" = weakref.WeakKeyDictionary()
+
+
+def get_shared_client() -> SearxngHttpClient:
+    """
+    Get the Searxng client shared by all tools on the running event loop.
+
+    Sharing it keeps connections to the server warm across independent tool
+    calls and lets one rate limiter see every request. Callers must not close
+    it; use aclose_shared_client() at shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared.get(loop)
+    if client is None:
+        client = SearxngHttpClient()
+        _shared[loop] = client
+    return client
+
+
+async def aclose_shared_client() -> None:
+    """Close the shared client of the running event loop, if one was created."""
+    client = _shared.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
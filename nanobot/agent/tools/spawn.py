@@ -62,17 +62,15 @@ class SpawnTool(Tool):
     
     async def execute(self, task: str, label: str | None = None, profile: str | None = None, **kwargs: Any) -> str:
         """Spawn a subagent to execute the given task."""
-        from nanobot.config.schema import AgentProfile
-
         # Resolve profile from config if specified
         agent_profile = None
         if profile:
             # Access config through manager
             config = self._manager.config
-            if config and profile in config.agents.profiles:
-                agent_profile = config.agents.profiles[profile]
-            else:
-                return f"Error: Agent profile '{profile}' not found. Available profiles: {', '.join(config.agents.profiles.keys()) if config and config.agents.profiles else 'none'}"
+            agent_profile = config.agents.profiles.get(profile) if config else None
+            if agent_profile is None:
+                available = ", ".join(config.agents.profiles) if config and config.agents.profiles else "none"
+                return f"Error: Agent profile '{profile}' not found. Available profiles: {available}"
 
         return await self._manager.spawn(
             task=task,
@@ -3,16 +3,39 @@
 from __future__ import annotations
 
 import json
+import os
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
+from loguru import logger
+
 from nanobot.agent.tools.base import Tool
+from nanobot.utils import jsonio
+
+# Sections of the "list" action, in display order
+_LIST_SECTIONS = (
+    ("pending", "## Ready to Start"),
+    ("blocked", "## Blocked (waiting for dependencies)"),
+    ("in_progress", "## In Progress"),
+    ("completed", "## Completed"),
+    ("deleted", "## Deleted (soft-deleted)"),
+)
 
 
 class TodoStore:
-    """Storage for todo items."""
+    """
+    Storage for todo items.
+
+    The state lives in a snapshot (todos.json) plus an append-only journal
+    (todos.log, one JSON record per line). A mutation appends one line to the
+    journal instead of rewriting every todo; once the journal outgrows
+    compact_bytes it is folded back into the snapshot.
+    """
+
+    # Journal size that triggers folding it into the snapshot
+    compact_bytes = 64 * 1024
 
     def __init__(self, workspace: Path, profile: str | None = None):
         self.workspace = workspace
@@ -26,19 +49,113 @@ class TodoStore:
 
         self.todo_dir.mkdir(parents=True, exist_ok=True)
         self.todo_file = self.todo_dir / "todos.json"
+        self.log_file = self.todo_dir / "todos.log"
+
+        # Parsed state, reused until the snapshot or journal changes on disk
+        self._cache: dict | None = None
+        self._cache_stamp: tuple | None = None
+        # id -> todo for the data last returned by _load, kept in step by mutations
+        self._by_id: dict[str, dict] = {}
+
+    def _stamp(self) -> tuple:
+        """(mtime_ns, size) of the snapshot and the journal; None for a missing file."""
+        stamps = []
+        for path in (self.todo_file, self.log_file):
+            try:
+                stat = path.stat()
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                stamps.append(None)
+        return tuple(stamps)
 
     def _load(self) -> dict:
-        """Load todos from file."""
-        if not self.todo_file.exists():
-            return {"todos": [], "next_id": 1}
+        """Load todos from disk, or from memory if nothing has changed."""
+        stamp = self._stamp()
+        if self._cache is not None and stamp == self._cache_stamp:
+            return self._cache
+
+        data = {"todos": [], "next_id": 1}
+        if stamp[0] is not None:
+            try:
+                data = jsonio.loads(self.todo_file.read_bytes())
+            except (json.JSONDecodeError, IOError):
+                pass
+        self._index(data)
+        if stamp[1] is not None:
+            self._replay(data)
+
+        self._cache, self._cache_stamp = data, stamp
+        return data
+
+    def _index(self, data: dict) -> dict:
+        """Rebuild the id index for freshly loaded data."""
+        self._by_id = {todo["id"]: todo for todo in data.get("todos", [])}
+        return data
+
+    def _replay(self, data: dict) -> None:
+        """Apply the journal's records on top of the snapshot in data."""
         try:
-            return json.loads(self.todo_file.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, IOError):
-            return {"todos": [], "next_id": 1}
-
-    def _save(self, data: dict) -> None:
-        """Save todos to file."""
-        self.todo_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+            lines = self.log_file.read_bytes().splitlines()
+        except IOError:
+            return
+        for line in lines:
+            try:
+                record = jsonio.loads(line)
+            except json.JSONDecodeError:
+                # A torn last line from an interrupted append
+                continue
+            for todo in record.get("put", ()):
+                current = self._by_id.get(todo["id"])
+                if current is None:
+                    data["todos"].append(todo)
+                else:
+                    current.clear()
+                    current.update(todo)
+                    todo = current
+                self._by_id[todo["id"]] = todo
+            if (todo_id := record.get("delete")) is not None and todo_id in self._by_id:
+                data["todos"].remove(self._by_id.pop(todo_id))
+            if "next_id" in record:
+                data["next_id"] = record["next_id"]
+
+    def _append(self, data: dict, record: dict) -> None:
+        """
+        Journal one mutation already applied to data.
+
+        Records are idempotent (whole todos, absolute next_id), so replaying a
+        journal that was already folded into the snapshot is harmless.
+        """
+        line = jsonio.dumps(record).encode("utf-8") + b"\n"
+        try:
+            with self.log_file.open("a+b") as f:
+                if f.tell():
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        # Don't glue this record onto a line torn by an interrupted append
+                        line = b"\n" + line
+                f.write(line)
+            stamp = self._stamp()
+        except Exception:
+            # data may hold unsaved edits; reread from disk next time
+            self._cache = self._cache_stamp = None
+            raise
+        self._cache, self._cache_stamp = data, stamp
+        if stamp[1] is not None and stamp[1][1] > self.compact_bytes:
+            self._compact(data)
+
+    def _compact(self, data: dict) -> None:
+        """Write data as the new snapshot and start an empty journal."""
+        # Write a sibling file and swap it in, so an interrupted save can never
+        # leave a truncated todos.json behind
+        tmp_file = self.todo_file.with_suffix(".json.tmp")
+        try:
+            tmp_file.write_text(jsonio.dumps(data, indent=True), encoding="utf-8")
+            os.replace(tmp_file, self.todo_file)
+            self.log_file.unlink(missing_ok=True)
+        except OSError as e:
+            # The journal still holds every change; try again on a later append
+            logger.warning("Failed to compact todo journal: {}", e)
+        self._cache, self._cache_stamp = data, self._stamp()
 
     def create(
         self,
@@ -50,21 +167,23 @@ class TodoStore:
         data = self._load()
         todo_id = str(data["next_id"])
         data["next_id"] += 1
+        now = datetime.now().isoformat()
 
         todo = {
             "id": todo_id,
             "subject": subject,
             "description": description,
             "status": "pending",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "metadata": metadata or {},
             "blocks": [],
             "blocked_by": [],
         }
 
         data["todos"].append(todo)
-        self._save(data)
+        self._by_id[todo_id] = todo
+        self._append(data, {"put": [todo], "next_id": data["next_id"]})
         return todo
 
     def list(self) -> list[dict]:
@@ -74,11 +193,8 @@ class TodoStore:
 
     def get(self, todo_id: str) -> dict | None:
         """Get a specific todo."""
-        data = self._load()
-        for todo in data.get("todos", []):
-            if todo["id"] == todo_id:
-                return todo
-        return None
+        self._load()
+        return self._by_id.get(todo_id)
 
     def update(
         self,
@@ -92,63 +208,65 @@ class TodoStore:
     ) -> dict | None:
         """Update a todo."""
         data = self._load()
-
-        for todo in data.get("todos", []):
-            if todo["id"] == todo_id:
-                if subject is not None:
-                    todo["subject"] = subject
-                if description is not None:
-                    todo["description"] = description
-                if status is not None:
-                    todo["status"] = status
-                if add_blocks is not None:
-                    for block_id in add_blocks:
-                        if block_id not in todo["blocks"]:
-                            todo["blocks"].append(block_id)
-                            # Add reverse dependency
-                            for other in data.get("todos", []):
-                                if other["id"] == block_id:
-                                    if todo_id not in other.get("blocked_by", []):
-                                        other["blocked_by"] = other.get("blocked_by", [])
-                                        other["blocked_by"].append(todo_id)
-                if add_blocked_by is not None:
-                    for block_id in add_blocked_by:
-                        if block_id not in todo["blocked_by"]:
-                            todo["blocked_by"].append(block_id)
-                            # Add reverse dependency
-                            for other in data.get("todos", []):
-                                if other["id"] == block_id:
-                                    if todo_id not in other.get("blocks", []):
-                                        other["blocks"] = other.get("blocks", [])
-                                        other["blocks"].append(todo_id)
-                if metadata is not None:
-                    todo["metadata"] = {**todo.get("metadata", {}), **metadata}
-
-                todo["updated_at"] = datetime.now().isoformat()
-                self._save(data)
-                return todo
-
-        return None
+        todo = self._by_id.get(todo_id)
+        if todo is None:
+            return None
+        # Todos whose fields change, for the journal record
+        changed = [todo]
+
+        if subject is not None:
+            todo["subject"] = subject
+        if description is not None:
+            todo["description"] = description
+        if status is not None:
+            todo["status"] = status
+        if add_blocks is not None:
+            for block_id in add_blocks:
+                if block_id not in todo["blocks"]:
+                    todo["blocks"].append(block_id)
+                    # Add reverse dependency
+                    other = self._by_id.get(block_id)
+                    if other is not None:
+                        blocked_by = other.setdefault("blocked_by", [])
+                        if todo_id not in blocked_by:
+                            blocked_by.append(todo_id)
+                            changed.append(other)
+        if add_blocked_by is not None:
+            for block_id in add_blocked_by:
+                if block_id not in todo["blocked_by"]:
+                    todo["blocked_by"].append(block_id)
+                    # Add reverse dependency
+                    other = self._by_id.get(block_id)
+                    if other is not None:
+                        blocks = other.setdefault("blocks", [])
+                        if todo_id not in blocks:
+                            blocks.append(todo_id)
+                            changed.append(other)
+        if metadata is not None:
+            todo["metadata"] = {**todo.get("metadata", {}), **metadata}
+
+        todo["updated_at"] = datetime.now().isoformat()
+        self._append(data, {"put": changed})
+        return todo
 
     def delete(self, todo_id: str, delete: bool = False) -> dict | None:
         """Delete or mark a todo as deleted."""
         data = self._load()
-
-        for i, todo in enumerate(data.get("todos", [])):
-            if todo["id"] == todo_id:
-                if delete:
-                    # Actually remove from list
-                    data["todos"].pop(i)
-                    self._save(data)
-                    return todo
-                else:
-                    # Mark as deleted
-                    todo["status"] = "deleted"
-                    todo["updated_at"] = datetime.now().isoformat()
-                    self._save(data)
-                    return todo
-
-        return None
+        todo = self._by_id.get(todo_id)
+        if todo is None:
+            return None
+
+        if delete:
+            # Actually remove from list
+            data["todos"].remove(todo)
+            del self._by_id[todo_id]
+            self._append(data, {"delete": todo_id})
+        else:
+            # Mark as deleted
+            todo["status"] = "deleted"
+            todo["updated_at"] = datetime.now().isoformat()
+            self._append(data, {"put": [todo]})
+        return todo
 
 
 class TodoTool(Tool):
@@ -264,46 +382,23 @@ Use 'todo' action='update' id='{todo['id']}' to make changes.
         if not todos:
             return "No tasks found. Create one with todo action='create'..."
 
-        # Group by status
-        pending = [t for t in todos if t["status"] == "pending" and not t.get("blocked_by")]
-        blocked = [t for t in todos if t["status"] == "pending" and t.get("blocked_by")]
-        in_progress = [t for t in todos if t["status"] == "in_progress"]
-        completed = [t for t in todos if t["status"] == "completed"]
-        deleted = [t for t in todos if t["status"] == "deleted"]
-
-        lines = []
-        lines.append(f"📋 Tasks ({len(todos)} total)\n")
-
-        if pending:
-            lines.append("## Ready to Start")
-            for todo in pending:
-                lines.append(f"  [{todo['id']}] {todo['subject']}")
-            lines.append("")
-
-        if blocked:
-            lines.append("## Blocked (waiting for dependencies)")
-            for todo in blocked:
-                blocks = ", ".join(todo.get("blocked_by", []))
-                lines.append(f"  [{todo['id']}] {todo['subject']} (blocked by: {blocks})")
-            lines.append("")
-
-        if in_progress:
-            lines.append("## In Progress")
-            for todo in in_progress:
-                lines.append(f"  [{todo['id']}] {todo['subject']}")
-            lines.append("")
-
-        if completed:
-            lines.append("## Completed")
-            for todo in completed:
-                lines.append(f"  [{todo['id']}] {todo['subject']}")
-            lines.append("")
-
-        if deleted:
-            lines.append("## Deleted (soft-deleted)")
-            for todo in deleted:
-                lines.append(f"  [{todo['id']}] {todo['subject']}")
-            lines.append("")
+        # Group by status in one pass; pending tasks with dependencies are "blocked"
+        sections: dict[str, list[str]] = {key: [] for key, _ in _LIST_SECTIONS}
+        for todo in todos:
+            status = todo["status"]
+            if status == "pending" and todo.get("blocked_by"):
+                sections["blocked"].append(
+                    f"  [{todo['id']}] {todo['subject']} (blocked by: {', '.join(todo['blocked_by'])})"
+                )
+            elif status in sections:
+                sections[status].append(f"  [{todo['id']}] {todo['subject']}")
+
+        lines = [f"📋 Tasks ({len(todos)} total)\n"]
+        for key, heading in _LIST_SECTIONS:
+            if sections[key]:
+                lines.append(heading)
+                lines.extend(sections[key])
+                lines.append("")
 
         return "\n".join(lines)
 
@@ -1,20 +1,30 @@
 """Web tools: web_search and web_fetch."""
 
+import asyncio
+import contextlib
 import html
-import json
+import inspect
+import io
+import itertools
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
-from urllib.parse import urlparse
 
 import httpx
+import lxml.html
 from loguru import logger
+from lxml import etree
 
 from nanobot.agent.tools.base import Tool
+from nanobot.agent.tools.http_pool import shared_client
+from nanobot.agent.tools.ratelimit import AdaptiveLimiter
+from nanobot.utils import jsonio
+from nanobot.utils.cache import TTLCache
 
 # Try to import Searxng HTTP client (optional, for multi-engine search)
 try:
-    from nanobot.agent.tools.searxng_http_client import SearxngHttpClient
+    from nanobot.agent.tools.searxng_http_client import SearxngHttpClient, get_shared_client
     SEARXNG_AVAILABLE = True
 except ImportError:
     SEARXNG_AVAILABLE = False
@@ -32,31 +42,197 @@ except ImportError:
     DDG_AVAILABLE = False
     logger.warning("ddgs package not installed. DuckDuckGo search will be unavailable. Install with: pip install ddgs")
 
+# Only older DDGS versions accept impersonate; newer ones handle it internally
+_DDG_ACCEPTS_IMPERSONATE = DDG_AVAILABLE and "impersonate" in inspect.signature(DDGS.__init__).parameters
+
+# Readability isolates the main article; without it every page takes the fast path
+try:
+    from readability import Document
+    READABILITY_AVAILABLE = True
+except ImportError:
+    READABILITY_AVAILABLE = False
+    logger.warning("readability-lxml not installed. web_fetch will convert whole pages. Install with: pip install readability-lxml")
+
+# Alternative engine names accepted from callers
+_ENGINE_ALIASES = {"auto": "ddg"}
+# Engines queried concurrently by engine="auto_race", when available
+_RACE_ENGINES = ("ddg", "searxng", "brave")
+
+# Default in-flight searches per engine: Brave's API quota is per second, DDG
+# throttles scrapers quickly, and a self-hosted Searxng fans out on its own
+_ENGINE_CONCURRENCY = {"brave": 4, "ddg": 2, "searxng": 8}
+
+# DDGS is synchronous; it runs on its own small pool so blocking searches
+# neither stall the event loop nor tie up the default executor
+_DDG_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="ddgs")
+
+# web_fetch stops downloading a page after max_chars * _FETCH_BYTES_PER_CHAR
+# bytes (markup outweighs text), but never below _FETCH_MIN_BYTES
+_FETCH_BYTES_PER_CHAR = 20
+_FETCH_MIN_BYTES = 1 << 20
+# Content types web_fetch refuses before reading the body
+_BINARY_TYPES = ("image/", "video/", "audio/", "application/octet-stream")
+# Pages smaller than this, or with fewer <p> tags, skip Readability: there is
+# no boilerplate worth scoring away
+_READABILITY_MIN_CHARS = 4096
+_READABILITY_MIN_PARAGRAPHS = 3
+
+
+# HTML cleanup patterns, compiled once for the web_fetch path
+# Elements _strip_tags drops together with their content
+_RE_SKIPPED_OPEN = re.compile(r'<(script|style)', re.I)
+_RE_SKIPPED_CLOSE = {name: re.compile(f'</{name}>', re.I) for name in ("script", "style")}
+_RE_TAG = re.compile(r'<[^>]+>')
+_RE_SPACES = re.compile(r'[ \t]+')
+_RE_NL = re.compile(r'\n{3,}')
+_RE_HEAD = re.compile(r'<head[\s>][\s\S]*?</head>', re.I)
+_RE_TITLE = re.compile(r'<title[^>]*>([\s\S]*?)</title>', re.I)
+# Opening <p> tags only, not <path>, <pre>, <param> or <picture>
+_RE_PARAGRAPH = re.compile(r'<p[\s>]', re.I)
+# http(s) scheme followed by a non-empty host
+_RE_URL = re.compile(r'^https?://[^/\s?#]+', re.I)
+_RE_WORD = re.compile(r'\w+')
+# Words that don't change what a query finds, ignored by the fuzzy search cache
+_QUERY_FILLER = frozenset({"a", "an", "the", "of", "for", "in", "on", "at", "to", "and", "with", "about"})
+
+# Tags _html_to_markdown ends with a blank line, and headings by level
+_BLOCK_TAGS = frozenset({"p", "div", "section", "article"})
+_HEADINGS = {f"h{level}": "#" * level for level in range(1, 7)}
+# Dropping comments at parse time keeps the text that follows them
+_HTML_PARSER = lxml.html.HTMLParser(remove_comments=True, remove_pis=True)
+
+
 def _strip_tags(text: str) -> str:
-    """Remove HTML tags and decode entities."""
-    text = re.sub(r'<script[\s\S]*?</script>', '', text, flags=re.I)
-    text = re.sub(r'<style[\s\S]*?</style>', '', text, flags=re.I)
-    text = re.sub(r'<[^>]+>', '', text)
-    return html.unescape(text).strip()
+    """Remove HTML tags, scripts and styles, and decode entities."""
+    # Skip script/style blocks by searching forward for their openers and
+    # closers, so an unclosed block can't make a lazy regex rescan the page
+    kept: list[str] = []
+    i = 0
+    while match := _RE_SKIPPED_OPEN.search(text, i):
+        kept.append(text[i:match.start()])
+        close = _RE_SKIPPED_CLOSE[match[1].lower()].search(text, match.end())
+        # An unclosed script/style swallows the rest of the page
+        i = close.end() if close else len(text)
+    kept.append(text[i:])
+    text = ''.join(kept)
+    # No tag can close after the last '>'; leave that tail alone so the tag
+    # regex doesn't retry every '<' in it
+    cut = text.rfind('>') + 1
+    return html.unescape(_RE_TAG.sub('', text[:cut]) + text[cut:]).strip()
 
 
 def _normalize(text: str) -> str:
     """Normalize whitespace."""
-    text = re.sub(r'[ \t]+', ' ', text)
-    return re.sub(r'\n{3,}', '\n\n', text).strip()
+    text = _RE_SPACES.sub(' ', text)
+    return _RE_NL.sub('\n\n', text).strip()
+
+
+def _html_to_markdown(src: str) -> str:
+    """Convert an HTML string to markdown; see _tree_to_markdown()."""
+    if not src.strip():
+        return ""
+    return _tree_to_markdown(lxml.html.fromstring(src, parser=_HTML_PARSER))
+
+
+def _tree_to_markdown(root: lxml.html.HtmlElement) -> str:
+    """
+    Convert a parsed HTML tree to markdown in one pass.
+
+    Links, headings and list items are rendered from their text content;
+    block ends become blank lines and <br>/<hr> line breaks. Everything
+    else contributes its text, except <script> and <style>.
+    """
+    parts: list[str] = []
+    walker = etree.iterwalk(root, events=("start", "end"))
+    for event, node in walker:
+        # Any remaining non-element node (e.g. an entity) has a non-string tag
+        tag = node.tag.lower() if isinstance(node.tag, str) else None
+        if event == "end":
+            if tag in _BLOCK_TAGS:
+                parts.append("\n\n")
+            if node.tail:
+                parts.append(node.tail)
+            continue
+
+        if tag == "a" and (href := node.get("href")):
+            parts.append(f"[{node.text_content().strip()}]({href})")
+        elif tag in _HEADINGS:
+            parts.append(f"\n{_HEADINGS[tag]} {node.text_content().strip()}\n")
+        elif tag == "li":
+            parts.append(f"\n- {node.text_content().strip()}")
+        elif tag is None or tag in ("script", "style"):
+            pass
+        else:
+            if tag in ("br", "hr"):
+                parts.append("\n")
+            if node.text:
+                parts.append(node.text)
+            continue
+        # Rendered (or dropped) as a whole; the end event still adds the tail
+        walker.skip_subtree()
+    return _normalize("".join(parts))
 
 
 def _validate_url(url: str) -> tuple[bool, str]:
     """Validate URL: must be http(s) with valid domain."""
-    try:
-        p = urlparse(url)
-        if p.scheme not in ('http', 'https'):
-            return False, f"Only http/https allowed, got '{p.scheme or 'none'}'"
-        if not p.netloc:
-            return False, "Missing domain"
+    if _RE_URL.match(url):
         return True, ""
-    except Exception as e:
-        return False, str(e)
+    # Only failures need to know why
+    scheme = url.partition(":")[0] if ":" in url else ""
+    if scheme.lower() not in ("http", "https"):
+        return False, f"Only http/https allowed, got '{scheme or 'none'}'"
+    return False, "Missing domain"
+
+
+def _cache_url(url: str) -> str:
+    """Cache key for a validated URL: scheme and host lowercased, fragment dropped."""
+    # The fragment is never sent, so "page#a" and "page#b" are the same fetch
+    origin = _RE_URL.match(url)[0]
+    return origin.lower() + url[len(origin):].partition("#")[0]
+
+
+def _fuzzy_query(query: str) -> str:
+    """Query with case, word order, punctuation and filler words normalized away."""
+    words = {word for word in _RE_WORD.findall(query.lower()) if word not in _QUERY_FILLER}
+    return " ".join(sorted(words)) or query.strip().lower()
+
+
+def _format_results(header: str, results: list[dict[str, str]], snippet_limit: int | None = None) -> str:
+    """Format normalized search results as the numbered text list returned to the agent."""
+    buf = io.StringIO()
+    buf.write(f"{header}\n")
+    for i, item in enumerate(results, 1):
+        buf.write(f"\n{i}. {item.get('title', '')}\n   {item.get('url', '')}")
+        if snippet := item.get("snippet"):
+            if snippet_limit and len(snippet) > snippet_limit:
+                snippet = f"{snippet[:snippet_limit]}..."
+            buf.write(f"\n   {snippet}")
+        # Show which engine provided this result
+        if engine := item.get("engine"):
+            buf.write(f"\n   Engine: {engine}")
+        if published_date := item.get("publishedDate"):
+            buf.write(f"\n   Published: {published_date}")
+    return buf.getvalue()
+
+
+def _resolve_engine(engine: str) -> str:
+    """Canonical lowercase engine name, with aliases ("auto") resolved."""
+    name = engine.lower()
+    return _ENGINE_ALIASES.get(name, name)
+
+
+def _freeze(kwargs: dict[str, Any]) -> tuple:
+    """Hashable, order-independent form of search kwargs (lists become tuples)."""
+    return tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in kwargs.items()))
+
+
+def _ddg_text(query: str, n: int, ddgs_kwargs: dict[str, Any]) -> list[dict[str, Any]]:
+    """Run a blocking DuckDuckGo text search (called on _DDG_EXECUTOR)."""
+    # Suppress ddgs library warnings (printed to stderr)
+    stderr_capture = io.StringIO()
+    with contextlib.redirect_stderr(stderr_capture):
+        ddgs = DDGS(**ddgs_kwargs)
+        return ddgs.text(query, max_results=n)
 
 
 class WebSearchTool(Tool):
@@ -66,10 +242,11 @@ class WebSearchTool(Tool):
     - searxng (Searxng): Multi-engine metasearch, aggregates from 70+ engines (best for research)
     - ddg (DuckDuckGo): General search, requires pip install ddgs
     - brave: Privacy-focused, requires BRAVE_API_KEY environment variable
+    - auto_race: Query every available engine at once and use the first answer
     """
 
     name = "web_search"
-    description = "Search web using multiple engines. Returns titles, URLs, and snippets. Engine options: 'searxng' (multi-engine metasearch, best for research), 'ddg' (DuckDuckGo - general search, default), 'brave' (privacy-focused, requires API key)."
+    description = "Search web using multiple engines. Returns titles, URLs, and snippets. Engine options: 'searxng' (multi-engine metasearch, best for research), 'ddg' (DuckDuckGo - general search, default), 'brave' (privacy-focused, requires API key), 'auto_race' (all available engines at once, fastest answer wins)."
     parameters = {
         "type": "object",
         "properties": {
@@ -77,8 +254,8 @@ class WebSearchTool(Tool):
             "count": {"type": "integer", "description": "Results (1-10)", "minimum": 1, "maximum": 10},
             "engine": {
                 "type": "string",
-                "description": "Search engine: 'searxng' (multi-engine metasearch), 'ddg' (DuckDuckGo, default), 'brave' (requires API key)",
-                "enum": ["searxng", "ddg", "brave"]
+                "description": "Search engine: 'searxng' (multi-engine metasearch), 'ddg' (DuckDuckGo, default), 'brave' (requires API key), 'auto_race' (fastest available engine)",
+                "enum": ["searxng", "ddg", "brave", "auto_race"]
             },
             "engines": {
                 "type": "array",
@@ -94,12 +271,27 @@ class WebSearchTool(Tool):
                 "type": "string",
                 "enum": ["day", "week", "month", "year"],
                 "description": "For searxng engine: filter results by time range"
+            },
+            "no_cache": {
+                "type": "boolean",
+                "description": "Skip cached results and search again (e.g. for breaking news)"
             }
         },
         "required": ["query"]
     }
 
-    def __init__(self, api_key: str | None = None, max_results: int = 5, engine: str = "ddg", impersonate: str = "random"):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_results: int = 5,
+        engine: str = "ddg",
+        impersonate: str = "random",
+        client: httpx.AsyncClient | None = None,
+        engine_concurrency: int | dict[str, int] | None = None,
+        cache_ttl: float = 600.0,
+        cache_size: int = 1024,
+        fuzzy_cache: bool = False,
+    ):
         """
         Initialize web search tool.
 
@@ -110,106 +302,129 @@ class WebSearchTool(Tool):
                        - "searxng": Use Searxng metasearch server (requires SEARXNG_URL)
                        - "ddg": Use DuckDuckGo - free, no API key needed (default)
                        - "brave": Use Brave API - requires api_key
+                       - "auto_race": Query all available engines concurrently
+                         and use the first non-empty answer
             impersonate: Browser impersonation for DuckDuckGo (default: "random")
                          Options: "random", "chrome", "firefox", "safari", etc.
+            client: Shared HTTP client for Brave/Searxng requests, so repeated
+                    searches reuse pooled connections. Owned by the caller.
+                    Without one, Brave requests use the event loop's shared
+                    client from http_pool.
+            engine_concurrency: Maximum in-flight searches per backend engine,
+                                so bursts (e.g. research fan-out) don't trip
+                                the engines' rate limits. An int applies to
+                                every engine; a dict overrides the defaults
+                                (brave 4, ddg 2, searxng 8) per engine. For
+                                Brave and Searxng this is the ceiling of their
+                                adaptive limiters; the shared Searxng client
+                                (used without a client) keeps its own ceiling
+            cache_ttl: Seconds a successful search is answered from memory
+                       (0 disables caching)
+            cache_size: Maximum number of cached searches
+            fuzzy_cache: Also answer rephrased queries from the cache when they
+                         differ only in case, word order, punctuation or
+                         filler words ("Python asyncio tutorial" and
+                         "tutorial for python asyncio")
         """
         self.api_key = api_key or os.environ.get("BRAVE_API_KEY", "")
         self.max_results = max_results
-        self.engine = engine.lower()
+        self.engine = _resolve_engine(engine)
         self.impersonate = impersonate
         self._ddg_available = DDG_AVAILABLE
-
-        # Initialize Searxng HTTP client if using searxng engine
+        self._client = client
+        if isinstance(engine_concurrency, int):
+            limits = dict.fromkeys(_ENGINE_CONCURRENCY, engine_concurrency)
+        else:
+            limits = {**_ENGINE_CONCURRENCY, **(engine_concurrency or {})}
+        # Backs off and shrinks concurrency when Brave answers 429
+        self._brave_limiter = AdaptiveLimiter(max_concurrency=limits["brave"])
+        # Brave and Searxng are capped by their adaptive limiters alone; only
+        # DDG, which has no limiter, needs a slot of its own
+        self._engine_slots = {"ddg": asyncio.Semaphore(limits["ddg"])}
+        # Retried agent steps often repeat a query; don't spend engine quota on it
+        self._cache = TTLCache(maxsize=cache_size, ttl=cache_ttl) if cache_ttl > 0 else None
+        self._fuzzy_cache = fuzzy_cache
+
+        # A caller-supplied HTTP client gets its own Searxng wrapper; otherwise
+        # searches go through the event loop's shared Searxng client
         self.searxng_client = None
-        if self.engine == "searxng" and SEARXNG_AVAILABLE:
-            self.searxng_client = SearxngHttpClient()
+        if client is not None and SEARXNG_AVAILABLE:
+            self.searxng_client = SearxngHttpClient(client=client, max_parallel=limits["searxng"])
 
-    async def _search_brave(self, query: str, n: int) -> str | None:
+    async def _http_get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """GET through the client supplied at init, else the loop's shared pooled client."""
+        return await (self._client or shared_client()).get(url, **kwargs)
+
+    async def _search_brave(self, query: str, n: int) -> list[dict[str, str]] | None:
         """Try searching with Brave API."""
         if not self.api_key:
             logger.debug("Brave API key not provided")
             return None
 
         try:
-            async with httpx.AsyncClient() as client:
-                r = await client.get(
-                    "https://api.search.brave.com/res/v1/web/search",
-                    params={"q": query, "count": n},
-                    headers={"Accept": "application/json", "X-Subscription-Token": self.api_key},
-                    timeout=15.0
-                )
-                r.raise_for_status()
+            r = await self._brave_limiter.request(lambda: self._http_get(
+                "https://api.search.brave.com/res/v1/web/search",
+                params={"q": query, "count": n},
+                headers={"Accept": "application/json", "X-Subscription-Token": self.api_key},
+                timeout=15.0
+            ))
+            r.raise_for_status()
 
             results = r.json().get("web", {}).get("results", [])
             if not results:
-                logger.debug(f"No Brave results for: {query}")
+                logger.debug("No Brave results for: {}", query)
                 return None
 
-            lines = [f"Brave results for: {query}\n"]
-            for i, item in enumerate(results[:n], 1):
-                lines.append(f"{i}. {item.get('title', '')}\n   {item.get('url', '')}")
-                if desc := item.get("description"):
-                    lines.append(f"   {desc}")
-            return "\n".join(lines)
+            return [
+                {"title": item.get("title", ""), "url": item.get("url", ""), "snippet": item.get("description") or ""}
+                for item in results[:n]
+            ]
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
                 logger.error("Brave API key is invalid or unauthorized")
             else:
-                logger.error(f"Brave API error: {e.response.status_code}")
+                logger.error("Brave API error: {}", e.response.status_code)
             return None
         except httpx.TimeoutException:
             logger.error("Brave API timeout")
             return None
         except Exception as e:
-            logger.error(f"Brave search failed: {e}")
+            logger.error("Brave search failed: {}", e)
             return None
 
-    async def _search_ddg(self, query: str, n: int) -> str | None:
+    async def _search_ddg(self, query: str, n: int) -> list[dict[str, str]] | None:
         """Try searching with DuckDuckGo."""
         if not self._ddg_available:
             logger.debug("DuckDuckGo (ddgs) not available")
             return None
 
         try:
-            # Initialize DDGS - impersonate is handled internally by the library
-            # Only pass impersonate if DDGS accepts it (older versions)
-            import inspect
-            import io
-            import contextlib
-            import sys
-
-            ddgs_kwargs = {}
-            if 'impersonate' in inspect.signature(DDGS.__init__).parameters:
-                ddgs_kwargs['impersonate'] = self.impersonate
-
-            # Suppress ddgs library warnings (printed to stderr)
-            stderr_capture = io.StringIO()
-            with contextlib.redirect_stderr(stderr_capture):
-                ddgs = DDGS(**ddgs_kwargs)
-                results = ddgs.text(query, max_results=n)
+            ddgs_kwargs = {"impersonate": self.impersonate} if _DDG_ACCEPTS_IMPERSONATE else {}
+
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(_DDG_EXECUTOR, _ddg_text, query, n, ddgs_kwargs)
 
             if not results:
-                logger.debug(f"No DuckDuckGo results for: {query}")
+                logger.debug("No DuckDuckGo results for: {}", query)
                 return None
 
-            lines = [f"DuckDuckGo results for: {query}\n"]
-            for i, item in enumerate(results[:n], 1):
-                lines.append(f"{i}. {item.get('title', '')}\n   {item.get('link', '')}")
-                if body := item.get("body"):
-                    lines.append(f"   {body}")
-            return "\n".join(lines)
+            return [
+                {"title": item.get("title", ""), "url": item.get("link", ""), "snippet": item.get("body") or ""}
+                for item in results[:n]
+            ]
         except Exception as e:
-            logger.error(f"DuckDuckGo search failed: {e}")
+            logger.error("DuckDuckGo search failed: {}", e)
             return None
 
-    async def _search_searxng(self, query: str, n: int, **kwargs: Any) -> str | None:
+    async def _search_searxng(
+        self, query: str, n: int, bypass_cache: bool = False, **kwargs: Any
+    ) -> list[dict[str, str]] | None:
         """Try searching with Searxng metasearch engine via HTTP."""
         if not SEARXNG_AVAILABLE:
             logger.debug("Searxng HTTP client not available")
             return None
 
-        if not self.searxng_client:
-            self.searxng_client = SearxngHttpClient()
+        searxng_client = self.searxng_client or get_shared_client()
 
         try:
             # Extract Searxng-specific parameters
@@ -218,7 +433,7 @@ class WebSearchTool(Tool):
             time_range = kwargs.get("time_range", None)
 
             # Perform search (async HTTP request)
-            results = await self.searxng_client.search(
+            results = await searxng_client.search(
                 query=query,
                 engines=engines,
                 categories=categories,
@@ -226,58 +441,131 @@ class WebSearchTool(Tool):
                 time_range=time_range,
                 safesearch=0,
                 count=n,
+                bypass_cache=bypass_cache,
             )
 
             if not results:
-                logger.debug(f"No Searxng results for: {query}")
+                logger.debug("No Searxng results for: {}", query)
                 return None
 
-            # Format results
-            engine_names = engines or ["multiple"]
-            lines = [f"Searxng results for: {query} (engines: {', '.join(engine_names)})\n"]
-
-            for i, result in enumerate(results[:n], 1):
-                lines.append(f"{i}. {result.get('title', '')}")
-                lines.append(f"   {result.get('url', '')}")
-                if content := result.get('content', ''):
-                    lines.append(f"   {content[:200]}{'...' if len(content) > 200 else ''}")
-                # Show which engine provided this result
-                if engine := result.get('engine', ''):
-                    lines.append(f"   Engine: {engine}")
-                if published_date := result.get('publishedDate'):
-                    lines.append(f"   Published: {published_date}")
-
-            return "\n".join(lines)
+            items = []
+            for result in results[:n]:
+                item = {
+                    "title": result.get("title", ""),
+                    "url": result.get("url", ""),
+                    "snippet": result.get("content", ""),
+                    # Which engine provided this result
+                    "engine": result.get("engine", ""),
+                }
+                if published_date := result.get("publishedDate"):
+                    item["publishedDate"] = published_date
+                items.append(item)
+            return items
 
         except Exception as e:
-            logger.error(f"Searxng search failed: {e}")
+            logger.error("Searxng search failed: {}", e)
             return None
 
-    async def _search_engine(self, engine: str, query: str, n: int, **kwargs: Any) -> str | None:
-        """Search using specified engine."""
-        # Handle "auto" by falling back to "ddg" (default)
-        if engine == "auto":
-            engine = "ddg"
+    async def _search_engine(
+        self, engine: str, query: str, n: int, no_cache: bool = False, **kwargs: Any
+    ) -> list[dict[str, str]] | None:
+        """
+        Search using specified engine, returning normalized results or None on failure.
 
+        no_cache skips cached answers; a fresh answer still refreshes the cache.
+        """
+        if engine not in ("searxng", "brave", "ddg"):
+            return None
+
+        # Only Searxng takes engines/categories/time_range; the others ignore kwargs
+        cache_query = _fuzzy_query(query) if self._fuzzy_cache else query
+        key = (engine, cache_query, n, _freeze(kwargs) if engine == "searxng" else ())
+        if self._cache is not None and not no_cache and (cached := self._cache.get(key)) is not None:
+            return list(cached)
+
+        async with self._engine_slots.get(engine) or contextlib.nullcontext():
+            if engine == "searxng":
+                results = await self._search_searxng(query, n, bypass_cache=no_cache, **kwargs)
+            elif engine == "brave":
+                results = await self._search_brave(query, n)
+            else:
+                results = await self._search_ddg(query, n)
+        if self._cache is not None and results:
+            self._cache.set(key, results)
+            return list(results)
+        return results
+
+    def _engine_available(self, engine: str) -> bool:
+        """Whether an engine is configured well enough to be worth trying."""
+        if engine == "ddg":
+            return self._ddg_available
+        if engine == "brave":
+            return bool(self.api_key)
         if engine == "searxng":
-            return await self._search_searxng(query, n, **kwargs)
-        elif engine == "brave":
-            return await self._search_brave(query, n)
-        elif engine == "ddg":
-            return await self._search_ddg(query, n)
-        return None
+            return SEARXNG_AVAILABLE and (self.searxng_client is not None or "SEARXNG_URL" in os.environ)
+        return False
+
+    async def _race_engines(self, query: str, n: int, **kwargs: Any) -> tuple[str, list[dict[str, str]]] | None:
+        """
+        Query every available engine at once and keep the first non-empty answer.
+
+        The slower searches are cancelled, so latency is that of the fastest
+        engine rather than primary latency plus failover.
+
+        Returns:
+            (engine, results) of the winner, or None if every engine failed.
+        """
+        async def attempt(engine: str) -> tuple[str, list[dict[str, str]] | None]:
+            return engine, await self._search_engine(engine, query, n, **kwargs)
+
+        tasks = [asyncio.create_task(attempt(engine)) for engine in _RACE_ENGINES if self._engine_available(engine)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                engine, results = await next_done
+                if results:
+                    return engine, results
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def execute_structured(
+        self, query: str, count: int | None = None, engine: str | None = None, **kwargs: Any
+    ) -> list[dict[str, str]]:
+        """
+        Search and return results as dicts instead of formatted text.
+
+        Each result has "title", "url" and "snippet"; Searxng results also carry
+        "engine" and, when known, "publishedDate". Returns an empty list if the
+        search failed or found nothing (details are logged).
+        """
+        n = min(max(count or self.max_results, 1), 10)
+        search_engine = _resolve_engine(engine) if engine else self.engine
+        if search_engine == "auto_race":
+            won = await self._race_engines(query, n, **kwargs)
+            return won[1] if won else []
+        return await self._search_engine(search_engine, query, n, **kwargs) or []
 
     async def execute(self, query: str, count: int | None = None, engine: str | None = None, **kwargs: Any) -> str:
         n = min(max(count or self.max_results, 1), 10)
 
         # Use engine from parameter if provided, otherwise use default
-        search_engine = (engine or self.engine).lower()
-
-        # Search using the specified engine
-        result = await self._search_engine(search_engine, query, n, **kwargs)
-
-        if result:
-            return result
+        search_engine = _resolve_engine(engine) if engine else self.engine
+
+        # Search using the specified engine; auto_race answers with whichever engine wins
+        if search_engine == "auto_race":
+            search_engine, results = await self._race_engines(query, n, **kwargs) or (search_engine, None)
+        else:
+            results = await self._search_engine(search_engine, query, n, **kwargs)
+
+        if results:
+            if search_engine == "searxng":
+                engine_names = kwargs.get("engines") or ["multiple"]
+                header = f"Searxng results for: {query} (engines: {', '.join(engine_names)})"
+                return _format_results(header, results, snippet_limit=200)
+            if search_engine == "brave":
+                return _format_results(f"Brave results for: {query}", results)
+            return _format_results(f"DuckDuckGo results for: {query}", results)
         elif search_engine == "searxng":
             if not SEARXNG_AVAILABLE:
                 return "Error: Searxng is not available. Check SEARXNG_PATH environment variable."
@@ -301,63 +589,146 @@ class WebFetchTool(Tool):
         "properties": {
             "url": {"type": "string", "description": "URL to fetch"},
             "extractMode": {"type": "string", "enum": ["markdown", "text"], "default": "markdown"},
-            "maxChars": {"type": "integer", "minimum": 100}
+            "maxChars": {"type": "integer", "minimum": 100},
+            "noCache": {"type": "boolean", "description": "Fetch again even if the page was fetched recently"}
         },
         "required": ["url"]
     }
 
-    def __init__(self, max_chars: int = 50000):
+    def __init__(
+        self,
+        max_chars: int = 50000,
+        client: httpx.AsyncClient | None = None,
+        cache_ttl: float = 300.0,
+        cache_size: int = 128,
+    ):
+        """
+        Args:
+            max_chars: Default cap on extracted text length.
+            client: HTTP client to fetch with, owned by the caller. Without
+                    one, fetches use the event loop's shared pooled client
+                    from http_pool, so repeated fetches reuse connections.
+            cache_ttl: Seconds a successful fetch is answered from memory
+                       (0 disables caching). Shorter than search caching,
+                       since pages change more often than result lists.
+            cache_size: Maximum number of cached fetches.
+        """
         self.max_chars = max_chars
+        self._client = client
+        self._cache = TTLCache(maxsize=cache_size, ttl=cache_ttl) if cache_ttl > 0 else None
 
-    async def execute(self, url: str, extractMode: str = "markdown", maxChars: int | None = None, **kwargs: Any) -> str:
-        from readability import Document
+    async def _fetch(self, url: str, max_chars: int) -> tuple[httpx.Response, str, str, bool]:
+        """
+        GET url, following at most MAX_REDIRECTS redirects, and read its body.
 
+        Bodies are streamed and cut off after enough bytes to yield max_chars
+        of text, so huge responses cost neither bandwidth nor parse time.
+
+        Returns:
+            The (closed) response, its lowercased content type, the decoded
+            body, and whether the body was cut off.
+        """
+        client = self._client or shared_client()
+        request = client.build_request("GET", url, headers={"User-Agent": USER_AGENT}, timeout=30.0)
+        # The redirect cap is per-client in httpx, and the pooled client is
+        # shared, so redirects are followed here instead
+        for _ in range(MAX_REDIRECTS + 1):
+            r = await client.send(request, stream=True)
+            if r.next_request is None:
+                break
+            await r.aclose()
+            request = r.next_request
+        else:
+            raise httpx.TooManyRedirects("Exceeded maximum allowed redirects.", request=request)
+
+        try:
+            r.raise_for_status()
+            ctype = r.headers.get("content-type", "").lower()
+            if ctype.startswith(_BINARY_TYPES):
+                # Nothing to extract text from; don't download it at all
+                raise ValueError(f"Unsupported content type: {ctype.split(';')[0]}")
+            limit = max(max_chars * _FETCH_BYTES_PER_CHAR, _FETCH_MIN_BYTES)
+            chunks: list[bytes] = []
+            size = 0
+            async for chunk in r.aiter_bytes(65536):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= limit:
+                    break
+            # Stopping at the limit means the rest went unread, even when the
+            # chunks happen to add up to exactly the limit
+            body, capped = b"".join(chunks)[:limit], size >= limit
+        finally:
+            await r.aclose()
+        return r, ctype, body.decode(r.charset_encoding or "utf-8", errors="replace"), capped
+
+    async def execute(
+        self, url: str, extractMode: str = "markdown", maxChars: int | None = None, noCache: bool = False, **kwargs: Any
+    ) -> str:
         max_chars = maxChars or self.max_chars
 
         # Validate URL before fetching
         is_valid, error_msg = _validate_url(url)
         if not is_valid:
-            return json.dumps({"error": f"URL validation failed: {error_msg}", "url": url}, ensure_ascii=False)
+            return jsonio.dumps({"error": f"URL validation failed: {error_msg}", "url": url})
+
+        key = (_cache_url(url), extractMode, max_chars)
+        if self._cache is not None and not noCache and (cached := self._cache.get(key)) is not None:
+            return cached
 
         try:
-            async with httpx.AsyncClient(
-                follow_redirects=True,
-                max_redirects=MAX_REDIRECTS,
-                timeout=30.0
-            ) as client:
-                r = await client.get(url, headers={"User-Agent": USER_AGENT})
-                r.raise_for_status()
-
-            ctype = r.headers.get("content-type", "")
-
-            # JSON
-            if "application/json" in ctype:
-                text, extractor = json.dumps(r.json(), indent=2, ensure_ascii=False), "json"
+            r, ctype, body, capped = await self._fetch(url, max_chars)
+
+            # JSON; a body cut off at the byte cap can't be parsed, so it is
+            # returned as is (and reported as truncated)
+            if "application/json" in ctype and not capped:
+                text, extractor = jsonio.dumps(jsonio.loads(body), indent=True), "json"
             # HTML
-            elif "text/html" in ctype or r.text[:256].lower().startswith(("<!doctype", "<html")):
-                doc = Document(r.text)
-                content = self._to_markdown(doc.summary()) if extractMode == "markdown" else _strip_tags(doc.summary())
-                text = f"# {doc.title()}\n\n{content}" if doc.title() else content
-                extractor = "readability"
+            elif "text/html" in ctype or body[:256].lstrip().lower().startswith(("<!doctype", "<html")):
+                # Parsing and scoring are CPU-bound; keep them off the event loop
+                text, extractor = await asyncio.to_thread(self._extract_html, body, extractMode)
+                logger.debug("web_fetch used the {} extractor for {} ({} chars)", extractor, url, len(body))
             else:
-                text, extractor = r.text, "raw"
+                text, extractor = body, "raw"
 
-            truncated = len(text) > max_chars
-            if truncated:
+            # A body cut off while downloading counts as truncated too
+            truncated = capped or len(text) > max_chars
+            if len(text) > max_chars:
                 text = text[:max_chars]
 
-            return json.dumps({"url": url, "finalUrl": str(r.url), "status": r.status_code,
-                              "extractor": extractor, "truncated": truncated, "length": len(text), "text": text}, ensure_ascii=False)
+            result = jsonio.dumps({"url": url, "finalUrl": str(r.url), "status": r.status_code,
+                                   "extractor": extractor, "truncated": truncated, "length": len(text), "text": text})
         except Exception as e:
-            return json.dumps({"error": str(e), "url": url}, ensure_ascii=False)
+            return jsonio.dumps({"error": str(e), "url": url})
+        if self._cache is not None:
+            self._cache.set(key, result)
+        return result
+
+    def _extract_html(self, body: str, extract_mode: str) -> tuple[str, str]:
+        """Extract the readable content of an HTML page; returns (text, extractor)."""
+        if (
+            not READABILITY_AVAILABLE
+            or len(body) < _READABILITY_MIN_CHARS
+            # Stop counting once there are enough
+            or len(list(itertools.islice(_RE_PARAGRAPH.finditer(body), _READABILITY_MIN_PARAGRAPHS)))
+            < _READABILITY_MIN_PARAGRAPHS
+        ):
+            title_match = _RE_TITLE.search(body)
+            title = _strip_tags(title_match[1]) if title_match else ""
+            page = _RE_HEAD.sub("", body)
+            content = self._to_markdown(page) if extract_mode == "markdown" else _strip_tags(page)
+            extractor = "fast"
+        else:
+            doc = Document(body)
+            title = doc.title()
+            # summary() serializes the cleaned article, but also leaves its tree
+            # in doc.html; walk that instead of parsing the HTML string again
+            doc.summary()
+            article = doc.html
+            content = _tree_to_markdown(article) if extract_mode == "markdown" else article.text_content().strip()
+            extractor = "readability"
+        return (f"# {title}\n\n{content}" if title else content), extractor
+
     def _to_markdown(self, html: str) -> str:
         """Convert HTML to markdown."""
-        # Convert links, headings, lists before stripping tags
-        text = re.sub(r'<a\s+[^>]*href=["\']([^"\']+)["\'][^>]*>([\s\S]*?)</a>',
-                      lambda m: f'[{_strip_tags(m[2])}]({m[1]})', html, flags=re.I)
-        text = re.sub(r'<h([1-6])[^>]*>([\s\S]*?)</h\1>',
-                      lambda m: f'\n{"#" * int(m[1])} {_strip_tags(m[2])}\n', html, flags=re.I)
-        text = re.sub(r'<li[^>]*>([\s\S]*?)</li>', lambda m: f'\n- {_strip_tags(m[1])}', html, flags=re.I)
-        text = re.sub(r'</(p|div|section|article)>', '\n\n', text, flags=re.I)
-        text = re.sub(r'<(br|hr)\s*/?>', '\n', text, flags=re.I)
-        return _normalize(_strip_tags(text))
+        return _html_to_markdown(html)
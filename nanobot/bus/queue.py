@@ -1,10 +1,26 @@
 """Async message queue for decoupled channel-agent communication."""
 
 import asyncio
-from typing import Callable, Awaitable
+from typing import Callable, Awaitable, TypeVar
+
+from loguru import logger
 
 from nanobot.bus.events import InboundMessage, OutboundMessage
 
+T = TypeVar("T")
+
+
+async def _get_batch(queue: "asyncio.Queue[T]", max_items: int) -> list[T]:
+    """Wait for one item, then take up to max_items - 1 more without waiting."""
+    # The only await is the first get(), so cancelling never loses drained items
+    items = [await queue.get()]
+    while len(items) < max_items:
+        try:
+            items.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    return items
+
 
 class MessageBus:
     """
@@ -12,11 +28,15 @@ class MessageBus:
 
     Channels push messages to the inbound queue, and the agent processes
     them and pushes responses to the outbound queue.
+
+    Both queues are bounded: when one is full, publish_* waits for the
+    consumer to catch up (backpressure) instead of buffering without limit,
+    while try_publish_* drops the new message. A maxsize of 0 means unbounded.
     """
 
-    def __init__(self):
-        self.inbound: asyncio.Queue[InboundMessage] = asyncio.Queue()
-        self.outbound: asyncio.Queue[OutboundMessage] = asyncio.Queue()
+    def __init__(self, inbound_maxsize: int = 1024, outbound_maxsize: int = 1024):
+        self.inbound: asyncio.Queue[InboundMessage] = asyncio.Queue(maxsize=inbound_maxsize)
+        self.outbound: asyncio.Queue[OutboundMessage] = asyncio.Queue(maxsize=outbound_maxsize)
         self._subscribers: list[Callable[[InboundMessage | OutboundMessage, str], Awaitable[None]]] = []
 
     def subscribe(self, callback: Callable[[InboundMessage | OutboundMessage, str], Awaitable[None]]) -> None:
@@ -24,19 +44,35 @@ class MessageBus:
         self._subscribers.append(callback)
 
     async def _notify(self, msg: InboundMessage | OutboundMessage, msg_type: str) -> None:
-        """Notify all subscribers of a message event."""
-        for subscriber in self._subscribers:
-            try:
-                await subscriber(msg, msg_type)
-            except Exception as e:
-                # Don't let subscriber errors break the message flow
-                pass
+        """Notify all subscribers of a message event, concurrently."""
+        if not self._subscribers:
+            return
+        # Snapshot, so a subscriber (un)subscribing mid-notify can't skew results
+        subscribers = tuple(self._subscribers)
+        results = await asyncio.gather(
+            *(subscriber(msg, msg_type) for subscriber in subscribers), return_exceptions=True
+        )
+        for subscriber, result in zip(subscribers, results):
+            # Don't let subscriber errors break the message flow
+            if isinstance(result, Exception):
+                name = getattr(subscriber, "__qualname__", subscriber)
+                logger.warning("Message bus subscriber {} failed: {}", name, result)
 
     async def publish_inbound(self, msg: InboundMessage) -> None:
         """Publish a message from a channel to the agent."""
         await self.inbound.put(msg)
         await self._notify(msg, "inbound")
 
+    async def try_publish_inbound(self, msg: InboundMessage) -> bool:
+        """Publish a message from a channel unless the inbound queue is full; returns whether it was queued."""
+        try:
+            self.inbound.put_nowait(msg)
+        except asyncio.QueueFull:
+            logger.warning("Inbound queue full, dropping message from {}:{}", msg.channel, msg.chat_id)
+            return False
+        await self._notify(msg, "inbound")
+        return True
+
     async def consume_inbound(self) -> InboundMessage:
         """Consume the next inbound message (blocks until available)."""
         return await self.inbound.get()
@@ -46,10 +82,28 @@ class MessageBus:
         await self.outbound.put(msg)
         await self._notify(msg, "outbound")
 
+    async def consume_inbound_batch(self, max_items: int = 32) -> list[InboundMessage]:
+        """Consume the next inbound message plus any already queued behind it, in order."""
+        return await _get_batch(self.inbound, max_items)
+
+    async def try_publish_outbound(self, msg: OutboundMessage) -> bool:
+        """Publish a response unless the outbound queue is full; returns whether it was queued."""
+        try:
+            self.outbound.put_nowait(msg)
+        except asyncio.QueueFull:
+            logger.warning("Outbound queue full, dropping message to {}:{}", msg.channel, msg.chat_id)
+            return False
+        await self._notify(msg, "outbound")
+        return True
+
     async def consume_outbound(self) -> OutboundMessage:
         """Consume the next outbound message (blocks until available)."""
         return await self.outbound.get()
 
+    async def consume_outbound_batch(self, max_items: int = 32) -> list[OutboundMessage]:
+        """Consume the next outbound message plus any already queued behind it, in order."""
+        return await _get_batch(self.outbound, max_items)
+
     @property
     def inbound_size(self) -> int:
         """Number of pending inbound messages."""
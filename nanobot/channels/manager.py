@@ -200,19 +200,21 @@ class ChannelManager:
         
         while True:
             try:
-                msg = await asyncio.wait_for(
-                    self.bus.consume_outbound(),
+                # Drain bursts in one wakeup instead of one wait_for per message
+                batch = await asyncio.wait_for(
+                    self.bus.consume_outbound_batch(),
                     timeout=1.0
                 )
                 
-                channel = self.channels.get(msg.channel)
-                if channel:
-                    try:
-                        await channel.send(msg)
-                    except Exception as e:
-                        logger.error("Error sending to {}: {}", msg.channel, e)
-                else:
-                    logger.warning("Unknown channel: {}", msg.channel)
+                for msg in batch:
+                    channel = self.channels.get(msg.channel)
+                    if channel:
+                        try:
+                            await channel.send(msg)
+                        except Exception as e:
+                            logger.error("Error sending to {}: {}", msg.channel, e)
+                    else:
+                        logger.warning("Unknown channel: {}", msg.channel)
                     
             except asyncio.TimeoutError:
                 continue
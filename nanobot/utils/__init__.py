@@ -2,6 +2,8 @@
 
 from nanobot.utils.helpers import ensure_dir, get_workspace_path, get_data_path
 from nanobot.utils.message import split_telegram_message, split_discord_message
+from nanobot.utils.cache import TTLCache
+from nanobot.utils import jsonio
 
 __all__ = [
     "ensure_dir",
@@ -9,4 +11,6 @@ __all__ = [
     "get_data_path",
     "split_telegram_message",
     "split_discord_message",
+    "TTLCache",
+    "jsonio",
 ]
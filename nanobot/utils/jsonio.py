@@ -0,0 +1,37 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any, indent: bool = False, default: Callable[[Any], Any] | None = None) -> str:
+    """
+    Serialize obj to a JSON string, keeping non-ASCII characters as-is.
+
+    Args:
+        obj: JSON-serializable object.
+        indent: Pretty-print with two-space indentation.
+        default: Called for objects the encoder can't serialize natively;
+            returns a serializable replacement.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        if default is not None:
+            # orjson serializes dataclasses natively; route them through default
+            # like the stdlib encoder does
+            option |= orjson.OPT_PASSTHROUGH_DATACLASS
+        return orjson.dumps(obj, default=default, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=default)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from str or UTF-8 bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,22 @@
+import asyncio
+
+from nanobot.agent.tools.http_pool import aclose_shared_client, shared_client
+
+
+async def test_shared_client_is_reused_until_closed() -> None:
+    client = shared_client()
+    assert shared_client() is client
+
+    await aclose_shared_client()
+    assert client.is_closed
+    assert shared_client() is not client
+    await aclose_shared_client()
+
+
+def test_shared_client_is_per_event_loop() -> None:
+    async def get_and_close():
+        client = shared_client()
+        await aclose_shared_client()
+        return client
+
+    assert asyncio.run(get_and_close()) is not asyncio.run(get_and_close())
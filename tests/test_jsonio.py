@@ -0,0 +1,37 @@
+import json
+from dataclasses import dataclass
+
+from nanobot.utils import jsonio
+
+
+def test_dumps_keeps_unicode_and_round_trips() -> None:
+    data = {"query": "café", "findings": [{"url": "https://example.com"}]}
+
+    text = jsonio.dumps(data)
+
+    assert "café" in text
+    assert jsonio.loads(text) == data
+    assert jsonio.loads(text.encode()) == data
+
+
+def test_dumps_indent_matches_stdlib_layout() -> None:
+    data = {"a": [1, 2], "b": {"c": "d"}}
+
+    assert jsonio.dumps(data, indent=True) == json.dumps(data, indent=2)
+
+
+def test_dumps_uses_default_hook() -> None:
+    class Point:
+        def __init__(self, x: int):
+            self.x = x
+
+    assert jsonio.loads(jsonio.dumps([Point(1)], default=lambda p: {"x": p.x})) == [{"x": 1}]
+
+
+def test_dumps_routes_dataclasses_through_default() -> None:
+    @dataclass
+    class Item:
+        name: str
+        hidden: str = ""
+
+    assert jsonio.loads(jsonio.dumps([Item("a")], default=lambda i: {"name": i.name})) == [{"name": "a"}]
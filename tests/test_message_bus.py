@@ -0,0 +1,67 @@
+import asyncio
+
+from nanobot.bus.events import InboundMessage
+from nanobot.bus.queue import MessageBus
+
+
+def _msg(text: str) -> InboundMessage:
+    return InboundMessage(channel="cli", sender_id="user", chat_id="direct", content=text)
+
+
+async def test_full_queue_applies_backpressure() -> None:
+    bus = MessageBus(inbound_maxsize=1)
+    await bus.publish_inbound(_msg("first"))
+
+    blocked = asyncio.create_task(bus.publish_inbound(_msg("second")))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+
+    assert (await bus.consume_inbound()).content == "first"
+    await blocked
+    assert (await bus.consume_inbound()).content == "second"
+
+
+async def test_try_publish_drops_when_full() -> None:
+    bus = MessageBus(inbound_maxsize=1)
+
+    assert await bus.try_publish_inbound(_msg("first"))
+    assert not await bus.try_publish_inbound(_msg("second"))
+    assert bus.inbound_size == 1
+
+
+async def test_subscribers_run_concurrently_and_failures_are_isolated() -> None:
+    bus = MessageBus()
+    seen: list[str] = []
+
+    async def slow(msg, msg_type: str) -> None:
+        await asyncio.sleep(0.05)
+        seen.append(f"slow:{msg_type}")
+
+    async def broken(msg, msg_type: str) -> None:
+        raise RuntimeError("sink down")
+
+    async def fast(msg, msg_type: str) -> None:
+        seen.append(f"fast:{msg_type}")
+
+    for subscriber in (slow, broken, fast):
+        bus.subscribe(subscriber)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await asyncio.gather(*(bus.publish_inbound(_msg(str(i))) for i in range(3)))
+
+    assert loop.time() - started < 0.15
+    assert seen.count("slow:inbound") == 3 and seen.count("fast:inbound") == 3
+    assert seen.index("fast:inbound") < seen.index("slow:inbound")
+
+
+async def test_consume_batch_drains_queued_messages_in_order() -> None:
+    bus = MessageBus()
+    for i in range(5):
+        await bus.publish_inbound(_msg(str(i)))
+
+    first = await bus.consume_inbound_batch(max_items=3)
+    rest = await bus.consume_inbound_batch()
+
+    assert [m.content for m in first] == ["0", "1", "2"]
+    assert [m.content for m in rest] == ["3", "4"]
@@ -0,0 +1,52 @@
+import httpx
+
+from nanobot.agent.tools.ratelimit import AdaptiveLimiter
+
+
+def _response(status: int, headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(status, headers=headers)
+
+
+async def test_request_retries_throttled_responses() -> None:
+    limiter = AdaptiveLimiter(max_concurrency=4, base_delay=0.001, max_delay=0.01)
+    responses = [_response(429, {"Retry-After": "0"}), _response(200)]
+    calls = 0
+
+    async def send() -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return responses.pop(0)
+
+    response = await limiter.request(send)
+
+    assert response.status_code == 200
+    assert calls == 2
+
+
+async def test_request_gives_up_after_max_attempts() -> None:
+    limiter = AdaptiveLimiter(max_attempts=3, base_delay=0.001, max_delay=0.01)
+    calls = 0
+
+    async def send() -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return _response(429)
+
+    response = await limiter.request(send)
+
+    assert response.status_code == 429
+    assert calls == 3
+
+
+def test_observe_applies_aimd() -> None:
+    limiter = AdaptiveLimiter(max_concurrency=8, min_concurrency=1, base_delay=0.001)
+
+    assert limiter.observe(_response(429)) is not None
+    assert limiter.limit == 4
+    limiter.observe(_response(429))
+    limiter.observe(_response(429))
+    limiter.observe(_response(429))
+    assert limiter.limit == 1
+
+    assert limiter.observe(_response(200)) is None
+    assert limiter.limit == 1.5
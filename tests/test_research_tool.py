@@ -0,0 +1,286 @@
+import hashlib
+import json
+from typing import Any
+
+from nanobot.agent.tools import research
+from nanobot.agent.tools.research import (
+    Finding,
+    ResearchTool,
+    Strategy,
+    _canonical_url,
+    _NearDuplicateIndex,
+    _search_strategies,
+    _YieldTracker,
+)
+
+SEARXNG_RESULT = """Searxng results for: python (engines: multiple)
+
+1. Python Docs
+   https://docs.python.org/3/
+   The official documentation.
+   Engine: bing
+   Published: 2024-01-01
+2. Python Wiki
+   https://wiki.python.org/
+"""
+
+DDG_RESULT = """DuckDuckGo results for: python
+
+1. Python Docs
+   https://docs.python.org/3/
+   Duplicate of the Searxng hit.
+2. Real Python
+   https://realpython.com/
+   Tutorials."""
+
+
+def _findings(tool: ResearchTool, search_result: str, seen_urls: set[str]) -> list[Finding]:
+    return list(tool._dedupe_findings(tool._parse_findings(search_result), seen_urls))
+
+
+class FakeSearch:
+    def __init__(self, result: str = DDG_RESULT):
+        self.result = result
+        self.queries: list[str] = []
+
+    async def execute(self, query: str, **kwargs: Any) -> str:
+        self.queries.append(query)
+        return self.result
+
+
+class FakeStructuredSearch:
+    def __init__(self, results: list[dict[str, str]]):
+        self.results = results
+        self.queries: list[str] = []
+
+    async def execute_structured(self, query: str, **kwargs: Any) -> list[dict[str, str]]:
+        self.queries.append(query)
+        return self.results
+
+
+def test_findings_parses_searxng_metadata() -> None:
+    tool = ResearchTool()
+    findings = _findings(tool, SEARXNG_RESULT, set())
+
+    assert [f.url for f in findings] == ["https://docs.python.org/3/", "https://wiki.python.org/"]
+    first = findings[0]
+    assert first.title == "Python Docs"
+    assert first.snippet == "The official documentation."
+    assert first.engine == "bing"
+    assert first.published_date == "2024-01-01"
+    assert findings[1].to_dict() == {"url": "https://wiki.python.org/", "title": "Python Wiki", "snippet": ""}
+
+
+def test_findings_skips_seen_urls() -> None:
+    tool = ResearchTool()
+    seen: set[str] = set()
+    _findings(tool, SEARXNG_RESULT, seen)
+    findings = _findings(tool, DDG_RESULT, seen)
+
+    assert [f.url for f in findings] == ["https://realpython.com/"]
+
+
+def test_findings_ignores_errors() -> None:
+    tool = ResearchTool()
+    assert _findings(tool, "Error: search failed", set()) == []
+
+
+async def test_execute_reports_deduplicated_findings() -> None:
+    tool = ResearchTool(structured=False)
+    tool.web_search = FakeSearch()
+
+    report = json.loads(await tool.execute("Python", mode="speed"))
+
+    assert report["total_sources"] == 2
+    assert report["iterations_completed"] == 2
+    assert [f["url"] for f in report["findings"]] == ["https://docs.python.org/3/", "https://realpython.com/"]
+    assert report["search_history"][0]["queries"] == ["python"]
+    assert "# Research Results: Python" in report["summary"]
+
+
+def test_findings_dedupes_tracking_variants() -> None:
+    tool = ResearchTool()
+    result = """1. Article
+   https://example.com/post?utm_source=x&id=2#top
+2. Same article
+   https://example.com/post?id=2&fbclid=abc
+3. Other article
+   https://example.com/post?id=3"""
+
+    findings = _findings(tool, result, set())
+
+    assert [f.url for f in findings] == [
+        "https://example.com/post?utm_source=x&id=2#top",
+        "https://example.com/post?id=3",
+    ]
+
+
+def test_yield_tracker_saturates_after_yield_collapses() -> None:
+    tracker = _YieldTracker()
+    saturated_at = None
+    for iteration, new_sources in enumerate([8, 6, 4, 0, 0, 0, 0, 0, 0]):
+        tracker.update(new_sources)
+        if tracker.saturated(iteration):
+            saturated_at = iteration
+            break
+
+    assert saturated_at is not None and saturated_at >= 4
+
+
+def test_yield_tracker_keeps_going_while_sources_arrive() -> None:
+    tracker = _YieldTracker()
+    for iteration in range(20):
+        tracker.update(1)
+        assert not tracker.saturated(iteration)
+
+
+async def test_execute_counts_sources_beyond_retained_findings() -> None:
+    tool = ResearchTool(structured=False)
+    tool.web_search = FakeSearch("\n".join(f"{i}. Page {i}\n   https://example.com/{i}" for i in range(1, 101)))
+
+    report = json.loads(await tool.execute("Python", mode="speed", max_results=100))
+
+    assert report["total_sources"] == 100
+    assert len(report["findings"]) == 20
+    assert "*... and 90 more sources*" in report["summary"]
+
+
+async def test_execute_never_repeats_a_query() -> None:
+    tool = ResearchTool(structured=False)
+    search = FakeSearch()
+    tool.web_search = search
+
+    report = json.loads(await tool.execute("Python", mode="quality"))
+
+    assert len(search.queries) == len(set(search.queries))
+    planned = [q for entry in report["search_history"] for q in entry["queries"]]
+    assert len(planned) == len(set(planned))
+
+
+async def test_execute_ranks_findings_by_title_relevance() -> None:
+    tool = ResearchTool(structured=False)
+    tool.web_search = FakeSearch("""1. Unrelated page
+   https://example.com/a
+2. Python asyncio tutorial
+   https://example.com/b
+3. Asyncio internals
+   https://example.com/c""")
+
+    report = json.loads(await tool.execute("Python asyncio", mode="speed"))
+
+    assert [f["url"] for f in report["findings"]] == [
+        "https://example.com/b",
+        "https://example.com/c",
+        "https://example.com/a",
+    ]
+
+
+def test_parse_findings_stops_at_limit() -> None:
+    tool = ResearchTool()
+    parsed = tool._parse_findings(SEARXNG_RESULT, limit=1)
+
+    assert [finding.url for _, finding in parsed] == ["https://docs.python.org/3/"]
+
+
+async def test_execute_uses_structured_results() -> None:
+    tool = ResearchTool()
+    tool.web_search = FakeStructuredSearch([
+        {"title": "Python Docs", "url": "https://docs.python.org/3/", "snippet": "Docs.", "engine": "bing"},
+        {"title": "Python Docs again", "url": "https://docs.python.org/3/?utm_source=x", "snippet": ""},
+        {"title": "Real Python", "url": "https://realpython.com/", "snippet": "Tutorials."},
+    ])
+
+    report = json.loads(await tool.execute("Python", mode="speed"))
+
+    assert report["total_sources"] == 2
+    assert report["findings"][0] == {
+        "url": "https://docs.python.org/3/", "title": "Python Docs", "snippet": "Docs.", "engine": "bing",
+    }
+
+
+def test_canonical_url_ignores_scheme_www_and_host_case() -> None:
+    assert _canonical_url("http://www.Example.com") == _canonical_url("https://example.com/")
+    assert _canonical_url("https://example.com/a?utm_source=x") == _canonical_url("https://example.com/a")
+    assert _canonical_url("https://example.com/a?id=1") != _canonical_url("https://example.com/a?id=2")
+
+
+def test_near_duplicate_index_flags_reposted_text() -> None:
+    index = _NearDuplicateIndex()
+    story = "Python 3.13 released with a new interactive interpreter and experimental free threading support"
+
+    assert index.add(story)
+    assert not index.add(story.upper().replace(" ", " - "))
+    assert index.add("Rust 1.80 ships lazy cell and exclusive range patterns for stable users")
+    # Short texts are never fingerprinted
+    assert index.add("Home")
+    assert index.add("Home")
+
+
+def test_simhash_is_stable_across_processes() -> None:
+    # One feature: the fingerprint is exactly its (unsalted) blake2b hash
+    digest = hashlib.blake2b(b"free threading python", digest_size=8).digest()
+    assert _NearDuplicateIndex.simhash(["free", "threading", "python"]) == int.from_bytes(digest, "little")
+
+
+def test_search_strategies_are_frozen_and_searxng_aware() -> None:
+    with_searxng = _search_strategies("python", 5, "balanced", True)
+    without_searxng = _search_strategies("python", 5, "balanced", False)
+
+    assert with_searxng == (Strategy("python latest news", ("bing", "brave"), ("news",), "week"),)
+    assert without_searxng == (Strategy("python latest news"),)
+    assert _search_strategies("python", 5, "balanced", True) is with_searxng
+
+
+def test_strategy_key_ignores_engine_and_category_order() -> None:
+    first = Strategy("python", ("bing", "brave"), ("news", "general"))
+    second = Strategy("python", ("brave", "bing"), ("general", "news"))
+
+    assert first.key() == second.key()
+    assert first.key() != Strategy("python", ("bing",), ("news", "general")).key()
+
+
+async def test_execute_ranks_on_snippet_when_titles_tie() -> None:
+    tool = ResearchTool(structured=False)
+    tool.web_search = FakeSearch("""1. Guide
+   https://example.com/a
+   A general guide.
+2. Guide
+   https://example.com/b
+   Using Python asyncio, step by step.""")
+
+    report = json.loads(await tool.execute("Python asyncio", mode="speed"))
+
+    assert [f["url"] for f in report["findings"]] == ["https://example.com/b", "https://example.com/a"]
+
+
+async def test_execute_reports_errors_as_json(monkeypatch) -> None:
+    tool = ResearchTool(structured=False)
+    tool.web_search = FakeSearch()
+
+    def fail(*args: Any) -> str:
+        raise RuntimeError("synthesis broke")
+
+    monkeypatch.setattr(tool, "_synthesize_results", fail)
+    report = json.loads(await tool.execute("Python", mode="speed"))
+
+    assert report["error"] == "synthesis broke"
+    assert report["partial_findings"][0] == {"url": "https://docs.python.org/3/", "title": "Python Docs",
+                                             "snippet": "Duplicate of the Searxng hit."}
+
+
+async def test_execute_reuses_recent_reports(monkeypatch) -> None:
+    tool = ResearchTool(structured=False)
+    search = FakeSearch()
+    tool.web_search = search
+
+    monkeypatch.setattr(research, "_now_str", lambda: "2024-01-01 00:00:00")
+    first = await tool.execute("Python", mode="speed")
+    searches = len(search.queries)
+    monkeypatch.setattr(research, "_now_str", lambda: "2024-01-01 00:05:00")
+    second = await tool.execute("  python ", mode="speed")
+
+    assert json.loads(second)["timestamp"] == "2024-01-01 00:05:00"
+    assert second.replace("00:05:00", "00:00:00") == first
+    assert len(search.queries) == searches
+    await tool.execute("Python", mode="balanced")
+    assert len(search.queries) > searches
@@ -0,0 +1,113 @@
+import asyncio
+
+import httpx
+
+from nanobot.agent.tools.searxng_http_client import (
+    SearxngHttpClient,
+    aclose_shared_client,
+    get_shared_client,
+)
+
+
+def _searxng_app(request: httpx.Request) -> httpx.Response:
+    assert request.headers["accept"] == "application/json"
+    assert request.url.params.get("engines") in (None, "bing", "brave")
+    query = request.url.params["q"]
+    return httpx.Response(200, json={"results": [
+        {"title": f"{query} result", "url": f"https://example.com/{query}", "content": "text", "engine": "bing"},
+    ]})
+
+
+async def test_context_manager_closes_owned_client() -> None:
+    async with SearxngHttpClient(base_url="http://searxng") as client:
+        http = client._get_client()
+
+    assert http.is_closed
+    assert client._client is None
+
+
+async def test_shared_client_is_reused_until_closed() -> None:
+    shared = get_shared_client()
+    assert get_shared_client() is shared
+
+    await aclose_shared_client()
+    assert get_shared_client() is not shared
+    await aclose_shared_client()
+
+
+async def test_parallel_searches_are_bounded() -> None:
+    active = peak = 0
+
+    async def slow_app(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return _searxng_app(request)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(slow_app)) as http:
+        client = SearxngHttpClient(base_url="http://searxng", client=http, max_parallel=2)
+        results = await asyncio.gather(*(client.search(f"q{i}") for i in range(5)))
+
+    assert peak == 2
+    assert [len(batch) for batch in results] == [1, 1, 1, 1, 1]
+
+
+async def test_search_caches_identical_queries() -> None:
+    requests: list[httpx.Request] = []
+
+    def counting_app(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return _searxng_app(request)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(counting_app)) as http:
+        client = SearxngHttpClient(base_url="http://searxng", client=http, cache_ttl=600.0)
+
+        first = await client.search("a", engines=["bing"])
+        assert await client.search("a", engines=["bing"]) == first
+        assert len(requests) == 1
+
+        await client.search("a", engines=["brave"])
+        await client.search("a", engines=["bing"], bypass_cache=True)
+        assert len(requests) == 3
+
+
+async def test_search_revalidates_with_etag() -> None:
+    statuses: list[int] = []
+
+    def etag_app(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("if-none-match") == '"v1"':
+            response = httpx.Response(304)
+        else:
+            response = _searxng_app(request)
+            response.headers["ETag"] = '"v1"'
+        statuses.append(response.status_code)
+        return response
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(etag_app)) as http:
+        client = SearxngHttpClient(base_url="http://searxng", client=http)
+
+        first = await client.search("a")
+        again = await client.search("a")
+
+    assert statuses == [200, 304]
+    assert again == first and again[0]["url"] == "https://example.com/a"
+
+
+async def test_health_check_is_debounced() -> None:
+    methods: list[str] = []
+
+    def app(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        return httpx.Response(200)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(app)) as http:
+        client = SearxngHttpClient(base_url="http://searxng", client=http)
+
+        assert await client.health_check()
+        assert await client.health_check()
+        client._last_health = (client._last_health[0] - client._health_ttl, True)
+        assert await client.health_check()
+
+    assert methods == ["HEAD", "HEAD"]
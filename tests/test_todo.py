@@ -0,0 +1,129 @@
+from pathlib import Path
+
+from nanobot.agent.tools.todo import TodoStore
+
+
+def test_store_round_trips_todos_through_disk(tmp_path: Path) -> None:
+    store = TodoStore(tmp_path)
+    first = store.create("Write docs", "Explain the todo tool", {"area": "docs"})
+    second = store.create("Ship", "Release it")
+    store.update(first["id"], add_blocks=[second["id"]])
+
+    reopened = TodoStore(tmp_path)
+
+    assert [t["subject"] for t in reopened.list()] == ["Write docs", "Ship"]
+    assert reopened.get(second["id"])["blocked_by"] == [first["id"]]
+    assert reopened.create("Third", "x")["id"] == "3"
+
+
+def test_store_treats_corrupt_file_as_empty(tmp_path: Path) -> None:
+    store = TodoStore(tmp_path)
+    store.todo_file.write_text("{not json", encoding="utf-8")
+
+    assert store.list() == []
+
+
+def test_store_reads_file_only_when_it_changes(tmp_path: Path, monkeypatch) -> None:
+    store = TodoStore(tmp_path)
+    store.create("Cached", "x")
+    reads = 0
+    read_bytes = Path.read_bytes
+
+    def counting_read_bytes(self: Path) -> bytes:
+        nonlocal reads
+        reads += 1
+        return read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+    store.list()
+    store.get("1")
+    assert reads == 0
+
+    # Another store (e.g. a second process) writes the file
+    TodoStore(tmp_path).create("External", "y")
+    assert [t["subject"] for t in store.list()] == ["Cached", "External"]
+    assert reads == 2
+
+
+def test_failed_compaction_keeps_every_change(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    store = TodoStore(tmp_path)
+    store.compact_bytes = 0
+    store.create("Kept", "x")
+    snapshot = store.todo_file.read_text(encoding="utf-8")
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    store.create("Journaled", "y")
+    monkeypatch.undo()
+
+    assert store.todo_file.read_text(encoding="utf-8") == snapshot
+    assert [t["subject"] for t in TodoStore(tmp_path).list()] == ["Kept", "Journaled"]
+
+
+def test_mutations_append_to_journal_until_compaction(tmp_path: Path) -> None:
+    store = TodoStore(tmp_path)
+    store.create("a", "a")
+    store.create("b", "b")
+    store.update("2", add_blocked_by=["1"])
+    store.delete("1", delete=True)
+
+    assert not store.todo_file.exists()
+    assert len(store.log_file.read_text(encoding="utf-8").splitlines()) == 4
+    # A torn final line from an interrupted append is ignored
+    with store.log_file.open("a", encoding="utf-8") as f:
+        f.write('{"put": [{"id"')
+    replayed = TodoStore(tmp_path)
+    assert [(t["id"], t["blocked_by"]) for t in replayed.list()] == [("2", ["1"])]
+    replayed.update("2", subject="b2")
+    assert TodoStore(tmp_path).get("2")["subject"] == "b2"
+
+    replayed.compact_bytes = 0
+    replayed.update("2", status="completed")
+    assert not replayed.log_file.exists()
+    assert [t["status"] for t in TodoStore(tmp_path).list()] == ["completed"]
+    assert TodoStore(tmp_path).create("c", "c")["id"] == "3"
+
+
+def test_store_update_and_delete_by_id(tmp_path: Path) -> None:
+    store = TodoStore(tmp_path)
+    for subject in ("a", "b", "c"):
+        store.create(subject, subject)
+
+    assert store.update("3", add_blocked_by=["1", "9"])["blocked_by"] == ["1", "9"]
+    assert store.get("1")["blocks"] == ["3"]
+    assert store.delete("2", delete=True)["subject"] == "b"
+    assert store.get("2") is None
+    assert store.update("2", status="completed") is None
+    assert store.delete("1")["status"] == "deleted"
+    assert [t["id"] for t in TodoStore(tmp_path).list()] == ["1", "3"]
+
+
+def test_new_todo_created_and_updated_at_match(tmp_path: Path) -> None:
+    todo = TodoStore(tmp_path).create("a", "b")
+
+    assert todo["created_at"] == todo["updated_at"]
+
+
+async def test_list_groups_tasks_by_status(tmp_path: Path) -> None:
+    from nanobot.agent.tools.todo import TodoTool
+
+    tool = TodoTool(tmp_path)
+    for subject in ("Ready", "Waiting", "Doing", "Done", "Dropped"):
+        await tool.execute("create", subject=subject, description="-")
+    await tool.execute("update", id="2", add_blocked_by=["1"])
+    await tool.execute("update", id="3", status="in_progress")
+    await tool.execute("complete", id="4")
+    await tool.execute("delete", id="5")
+
+    assert await tool.execute("list") == (
+        "📋 Tasks (5 total)\n\n"
+        "## Ready to Start\n  [1] Ready\n\n"
+        "## Blocked (waiting for dependencies)\n  [2] Waiting (blocked by: 1)\n\n"
+        "## In Progress\n  [3] Doing\n\n"
+        "## Completed\n  [4] Done\n\n"
+        "## Deleted (soft-deleted)\n  [5] Dropped\n"
+    )
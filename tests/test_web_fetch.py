@@ -0,0 +1,206 @@
+import json
+
+import httpx
+
+from nanobot.agent.tools import web
+from nanobot.agent.tools.web import (
+    MAX_REDIRECTS,
+    WebFetchTool,
+    WebSearchTool,
+    _html_to_markdown,
+    _strip_tags,
+    _validate_url,
+)
+
+
+def test_html_to_markdown_renders_links_headings_and_lists() -> None:
+    src = (
+        "<html><body><div>"
+        "<p>Read <a href='https://docs.python.org/'>the <b>docs</b></a> &amp; more</p>"
+        "<h2>Install</h2>"
+        "<ul><li>pip</li><li>uv</li></ul>"
+        "</div></body></html>"
+    )
+
+    assert _html_to_markdown(src) == (
+        "Read [the docs](https://docs.python.org/) & more\n\n"
+        "## Install\n\n"
+        "- pip\n"
+        "- uv"
+    )
+
+
+def test_html_to_markdown_drops_scripts_and_comments_but_keeps_their_tails() -> None:
+    src = "<div>one<br>two<script>var x = 1;</script> three<!-- note --> four<style>p {}</style></div>"
+
+    assert _html_to_markdown(src) == "one\ntwo three four"
+    assert _html_to_markdown("") == ""
+
+
+def test_strip_tags_drops_scripts_styles_and_unclosed_blocks() -> None:
+    assert _strip_tags("<p>a &amp; b</p><SCRIPT>x<y</script><style>p{}</STYLE> c") == "a & b c"
+    assert _strip_tags("<b>1</b> < 2 < 3") == "1 < 2 < 3"
+    assert _strip_tags("kept<script>" + "<script>" * 1000) == "kept"
+
+
+async def test_fetch_follows_a_bounded_number_of_redirects() -> None:
+    def app(request: httpx.Request) -> httpx.Response:
+        hops = int(request.url.params.get("hops", "0"))
+        if hops:
+            return httpx.Response(302, headers={"Location": f"/page?hops={hops - 1}"})
+        return httpx.Response(200, json={"ok": True})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(app)) as http:
+        tool = WebFetchTool(client=http)
+        ok = json.loads(await tool.execute(f"https://example.com/page?hops={MAX_REDIRECTS}"))
+        too_many = json.loads(await tool.execute(f"https://example.com/page?hops={MAX_REDIRECTS + 1}"))
+
+    assert ok["finalUrl"] == "https://example.com/page?hops=0"
+    assert ok["text"] == '{\n  "ok": true\n}'
+    assert "redirect" in too_many["error"].lower()
+
+
+async def test_repeated_fetches_and_searches_are_cached() -> None:
+    requests: list[str] = []
+
+    def app(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path == "/search":
+            return httpx.Response(200, json={"results": [{"title": "T", "url": "https://example.com/"}]})
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, text="plain")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(app)) as http:
+        fetch = WebFetchTool(client=http)
+        assert await fetch.execute("https://example.com/page") == await fetch.execute("https://example.com/page")
+        await fetch.execute("https://example.com/page", extractMode="text")
+        await fetch.execute("https://example.com/missing")
+        await fetch.execute("https://example.com/missing")
+
+        search = WebSearchTool(engine="searxng", client=http)
+        await search.execute("q", engines=["bing"])
+        await search.execute_structured("q", engines=["bing"])
+        await search.execute("q", engines=["brave"])
+
+    assert requests == ["/page", "/page", "/missing", "/missing", "/search", "/search"]
+
+
+async def test_no_cache_refetches_and_fragments_share_an_entry() -> None:
+    requests: list[str] = []
+
+    def app(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path == "/search":
+            return httpx.Response(200, json={"results": [{"title": "T", "url": "https://example.com/"}]})
+        return httpx.Response(200, text="plain")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(app)) as http:
+        fetch = WebFetchTool(client=http)
+        await fetch.execute("https://example.com/page#intro")
+        await fetch.execute("https://EXAMPLE.com/page#usage")
+        await fetch.execute("https://example.com/page", noCache=True)
+
+        search = WebSearchTool(engine="searxng", client=http)
+        await search.execute("q")
+        await search.execute("q")
+        await search.execute("q", no_cache=True)
+
+    assert requests == ["/page", "/page", "/search", "/search"]
+
+
+async def test_fetch_stops_reading_large_bodies() -> None:
+    sent = 0
+
+    async def body():
+        nonlocal sent
+        for _ in range(64):
+            sent += 65536
+            yield b"x" * 65536
+
+    def app(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "text/plain"}, content=body())
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(app)) as http:
+        result = json.loads(await web.WebFetchTool(client=http).execute("https://example.com/big", maxChars=100))
+
+    assert result["truncated"] and result["length"] == 100
+    assert sent <= web._FETCH_MIN_BYTES + 65536
+
+
+async def test_fetch_caps_json_bodies_too() -> None:
+    sent = 0
+
+    async def body():
+        nonlocal sent
+        yield b'{"items": ['
+        for _ in range(64):
+            sent += 65536
+            yield b'"x",' * 16384
+
+    def app(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "application/json"}, content=body())
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(app)) as http:
+        result = json.loads(await web.WebFetchTool(client=http).execute("https://example.com/api", maxChars=100))
+
+    assert result["extractor"] == "raw" and result["truncated"]
+    assert result["text"].startswith('{"items": ["x",')
+    assert sent <= web._FETCH_MIN_BYTES + 65536
+
+
+async def test_small_pages_skip_readability() -> None:
+    page = "<html><head><title>Tiny &amp; fast</title></head><body><h1>Hi</h1><p>Short page.</p></body></html>"
+    article = (
+        "<html><head><title>Article</title></head><body><nav>Menu</nav><article>"
+        + "".join(f"<p>Paragraph {i} with enough words to look like real content.</p>" for i in range(100))
+        + "</article></body></html>"
+    )
+
+    def app(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "text/html"}, text=page if request.url.path == "/tiny" else article)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(app)) as http:
+        tool = WebFetchTool(client=http)
+        tiny = json.loads(await tool.execute("https://example.com/tiny"))
+        long = json.loads(await tool.execute("https://example.com/article"))
+
+    assert tiny["extractor"] == "fast"
+    assert tiny["text"] == "# Tiny & fast\n\n# Hi\nShort page."
+    assert long["extractor"] == "readability"
+    assert long["text"].startswith("# Article\n\nParagraph 0")
+
+
+def test_only_real_paragraphs_count_towards_readability() -> None:
+    svg = "<svg>" + '<path d="M0 0"/>' * 500 + "</svg>"
+    page = f"<html><body><pre>code</pre>{svg}<p>Only paragraph.</p></body></html>"
+
+    assert WebFetchTool()._extract_html(page, "text")[1] == "fast"
+    assert WebFetchTool()._extract_html(page.replace("<p>", "<P>") * 3, "text")[1] == "readability"
+
+
+async def test_fetch_refuses_binary_content_without_reading_it() -> None:
+    sent = 0
+
+    async def body():
+        nonlocal sent
+        for _ in range(4):
+            sent += 65536
+            yield b"\x89PNG" * 16384
+
+    def app(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "image/png"}, content=body())
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(app)) as http:
+        result = json.loads(await WebFetchTool(client=http).execute("https://example.com/logo.png"))
+
+    assert result["error"] == "Unsupported content type: image/png"
+    assert sent == 0
+
+
+def test_validate_url() -> None:
+    assert _validate_url("https://example.com/path?q=1") == (True, "")
+    assert _validate_url("HTTP://Example.com") == (True, "")
+    assert _validate_url("ftp://example.com") == (False, "Only http/https allowed, got 'ftp'")
+    assert _validate_url("example.com") == (False, "Only http/https allowed, got 'none'")
+    assert _validate_url("https:///path") == (False, "Missing domain")
@@ -0,0 +1,139 @@
+import asyncio
+import threading
+
+import httpx
+
+from nanobot.agent.tools import web
+from nanobot.agent.tools.web import WebSearchTool
+
+
+def _searxng_app(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"results": [
+        {"title": "Python", "url": "https://python.org/", "content": "x" * 250, "engine": "bing",
+         "publishedDate": "2024-01-01"},
+    ]})
+
+
+async def test_searxng_text_and_structured_results_agree() -> None:
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_searxng_app)) as http:
+        tool = WebSearchTool(engine="searxng", client=http)
+        text = await tool.execute("python")
+        structured = await tool.execute_structured("python")
+
+    assert text == (
+        "Searxng results for: python (engines: multiple)\n\n"
+        "1. Python\n"
+        "   https://python.org/\n"
+        f"   {'x' * 200}...\n"
+        "   Engine: bing\n"
+        "   Published: 2024-01-01"
+    )
+    assert structured == [{
+        "title": "Python", "url": "https://python.org/", "snippet": "x" * 250, "engine": "bing",
+        "publishedDate": "2024-01-01",
+    }]
+
+
+async def test_ddg_search_runs_off_the_event_loop(monkeypatch) -> None:
+    threads = []
+
+    class FakeDDGS:
+        def __init__(self, **kwargs):
+            pass
+
+        def text(self, query, max_results):
+            threads.append(threading.current_thread().name)
+            return [{"title": "T", "link": "https://example.com", "body": "B"}]
+
+    monkeypatch.setattr(web, "DDGS", FakeDDGS)
+    tool = WebSearchTool(engine="ddg")
+    tool._ddg_available = True
+
+    assert await tool.execute_structured("q") == [{"title": "T", "url": "https://example.com", "snippet": "B"}]
+    assert threads[0].startswith("ddgs")
+
+
+async def test_searches_per_engine_are_bounded() -> None:
+    active = peak = 0
+
+    async def slow_searxng(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return _searxng_app(request)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(slow_searxng)) as http:
+        tool = WebSearchTool(engine="searxng", client=http, engine_concurrency=2)
+        await asyncio.gather(*(tool.execute_structured(f"q{i}") for i in range(6)))
+
+    assert peak == 2
+
+
+async def test_engine_concurrency_overrides_one_engine() -> None:
+    active = peak = 0
+
+    async def slow_searxng(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return _searxng_app(request)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(slow_searxng)) as http:
+        tool = WebSearchTool(engine="searxng", client=http, engine_concurrency={"searxng": 3})
+        await asyncio.gather(*(tool.execute_structured(f"q{i}") for i in range(9)))
+
+    assert peak == 3
+    assert tool._engine_slots["ddg"]._value == 2
+
+
+async def test_auto_race_returns_first_non_empty_engine() -> None:
+    tool = WebSearchTool(api_key="key")
+    tool._ddg_available = True
+    cancelled = []
+
+    async def empty_ddg(query, n):
+        return None
+
+    async def slow_brave(query, n):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append("brave")
+            raise
+
+    async def fast_searxng(query, n, **kwargs):
+        await asyncio.sleep(0.01)
+        return [{"title": "Python", "url": "https://python.org/", "snippet": "", "engine": "bing"}]
+
+    tool._search_ddg = empty_ddg
+    tool._search_brave = slow_brave
+    tool._search_searxng = fast_searxng
+    tool._engine_available = lambda engine: True
+
+    text = await tool.execute("python", engine="auto_race")
+    await asyncio.sleep(0)
+
+    assert text.startswith("Searxng results for: python")
+    assert cancelled == ["brave"]
+
+
+async def test_fuzzy_cache_answers_rephrased_queries() -> None:
+    requests: list[str] = []
+
+    def app(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.params["q"])
+        return _searxng_app(request)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(app)) as http:
+        exact = WebSearchTool(engine="searxng", client=http)
+        fuzzy = WebSearchTool(engine="searxng", client=http, fuzzy_cache=True)
+        for tool in (exact, fuzzy):
+            await tool.execute_structured("Python asyncio tutorial")
+            await tool.execute_structured("tutorial for python asyncio?")
+            await tool.execute_structured("python asyncio")
+
+    assert len(requests) == 5